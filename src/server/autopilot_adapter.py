@@ -7,6 +7,14 @@ from mavsdk import System
 SUPPORTED_AUTOPILOT_BACKENDS = ("px4", "ardupilot")
 DEFAULT_AUTOPILOT_BACKEND = "px4"
 
+# Flat-earth conversion (111320 m per degree of latitude), shared with droneserver.offset_gps
+_DEG_PER_M_LAT = 1.0 / 111320.0
+_DEG2RAD = math.pi / 180.0
+
+# Telemetry flight modes ArduPilot reports once a goto has put it in GUIDED
+# (MAVSDK maps ArduPilot GUIDED onto OFFBOARD)
+_ARDUPILOT_GUIDED_MODES = frozenset({"GUIDED", "OFFBOARD"})
+
 
 class AutopilotAdapter:
     backend_name: str
@@ -57,11 +65,11 @@ def resolve_autopilot_backend(raw_backend: str | None) -> str:
     return resolved
 
 
-def create_autopilot_adapter(drone: System, backend_name: str) -> AutopilotAdapter:
+def create_autopilot_adapter(drone: System, backend_name: str, telemetry=None) -> AutopilotAdapter:
     if backend_name == "px4":
-        return PX4Adapter(drone)
+        return PX4Adapter(drone, telemetry)
     if backend_name == "ardupilot":
-        return ArduPilotAdapter(drone)
+        return ArduPilotAdapter(drone, telemetry)
     raise ValueError(f"Unsupported backend '{backend_name}'")
 
 
@@ -69,8 +77,10 @@ class BaseAutopilotAdapter(AutopilotAdapter):
     backend_name = "unknown"
     capabilities: dict[str, bool] = {}
 
-    def __init__(self, drone: System):
+    def __init__(self, drone: System, telemetry=None):
         self.drone = drone
+        # Optional TelemetryService; position reads use its cache when fresh
+        self.telemetry = telemetry
 
     async def get_backend_info(self) -> dict:
         return {
@@ -114,11 +124,11 @@ class BaseAutopilotAdapter(AutopilotAdapter):
         current_lon = position.longitude_deg
         current_alt = position.absolute_altitude_m
 
-        lat_offset_deg = north_m / 111320.0
-        cos_lat = math.cos(math.radians(current_lat))
+        lat_offset_deg = north_m * _DEG_PER_M_LAT
+        cos_lat = math.cos(current_lat * _DEG2RAD)
         if abs(cos_lat) < 1e-6:
             raise ValueError("Relative movement is undefined at extreme latitudes.")
-        lon_offset_deg = east_m / (111320.0 * cos_lat)
+        lon_offset_deg = east_m * _DEG_PER_M_LAT / cos_lat
         target_alt = current_alt - down_m
         target_lat = current_lat + lat_offset_deg
         target_lon = current_lon + lon_offset_deg
@@ -133,7 +143,16 @@ class BaseAutopilotAdapter(AutopilotAdapter):
         return goto_result
 
     async def _read_position(self):
-        return await self.drone.telemetry.position().__anext__()
+        telemetry = self.telemetry
+        # Targets are computed from this position, so only trust a fresh sample
+        if telemetry is not None and telemetry.get_age("position") <= telemetry.FRESH_THRESHOLD_S:
+            return telemetry.get("position")
+        positions = self.drone.telemetry.position()
+        try:
+            return await positions.__anext__()
+        finally:
+            # Release the gRPC subscription instead of leaving it to GC
+            await positions.aclose()
 
 
 class PX4Adapter(BaseAutopilotAdapter):
@@ -152,6 +171,7 @@ class PX4Adapter(BaseAutopilotAdapter):
                 "semantic_mode": "HOLD",
                 "adapter_action": "hold",
                 "message": "Flight mode changed to HOLD",
+                "expected_modes": {"HOLD"},
             }
         if mode in ("RTL", "RETURN_TO_LAUNCH"):
             await self.drone.action.return_to_launch()
@@ -159,6 +179,7 @@ class PX4Adapter(BaseAutopilotAdapter):
                 "semantic_mode": "RTL",
                 "adapter_action": "return_to_launch",
                 "message": "Flight mode changed to RTL",
+                "expected_modes": {"RETURN_TO_LAUNCH"},
             }
         if mode == "LAND":
             await self.drone.action.land()
@@ -166,6 +187,7 @@ class PX4Adapter(BaseAutopilotAdapter):
                 "semantic_mode": "LAND",
                 "adapter_action": "land",
                 "message": "Flight mode changed to LAND",
+                "expected_modes": {"LAND"},
             }
         if mode == "GUIDED":
             return {
@@ -231,6 +253,7 @@ class ArduPilotAdapter(BaseAutopilotAdapter):
                 "semantic_mode": "HOLD",
                 "adapter_action": "goto_current_position",
                 "message": "Flight mode changed to HOLD/LOITER",
+                "expected_modes": _ARDUPILOT_GUIDED_MODES,
                 "note": "ArduPilot hold semantics use a current-position goto to preserve station keeping.",
             }
         if mode in ("RTL", "RETURN_TO_LAUNCH"):
@@ -239,6 +262,7 @@ class ArduPilotAdapter(BaseAutopilotAdapter):
                 "semantic_mode": "RTL",
                 "adapter_action": "return_to_launch",
                 "message": "Flight mode changed to RTL",
+                "expected_modes": {"RETURN_TO_LAUNCH"},
             }
         if mode == "LAND":
             await self.drone.action.land()
@@ -246,6 +270,7 @@ class ArduPilotAdapter(BaseAutopilotAdapter):
                 "semantic_mode": "LAND",
                 "adapter_action": "land",
                 "message": "Flight mode changed to LAND",
+                "expected_modes": {"LAND"},
             }
         if mode == "GUIDED":
             position = await self._read_position()
@@ -259,6 +284,7 @@ class ArduPilotAdapter(BaseAutopilotAdapter):
                 "semantic_mode": "GUIDED",
                 "adapter_action": "goto_current_position",
                 "message": "Flight mode changed to GUIDED",
+                "expected_modes": _ARDUPILOT_GUIDED_MODES,
                 "note": "ArduPilot enters GUIDED semantics when it receives a goto command.",
             }
         raise ValueError(f"Unsupported mode '{mode}'")
@@ -1,5 +1,5 @@
 # Add lifespan support for startup/shutdown with strong typing
-from contextlib import asynccontextmanager
+from contextlib import aclosing, asynccontextmanager
 from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from mcp.server.fastmcp import Context, FastMCP
@@ -7,17 +7,27 @@ from typing import Any, Tuple
 from mavsdk import System
 from mavsdk.mission_raw import MissionItem
 from mavsdk.geofence import Point as GeoPoint, Polygon as GeoPolygon, FenceType, GeofenceData
+from mavsdk.param import ParamError
 from enum import Enum
 import asyncio
+import atexit
+import bisect
+import functools
+import itertools
 import os
 import logging
+import logging.handlers
 import math
+import operator
+import queue
 import uuid
 import time
 import json
 from dotenv import load_dotenv
 from pathlib import Path
 from src.server.autopilot_adapter import (
+    _DEG2RAD,
+    _DEG_PER_M_LAT,
     AutopilotAdapter,
     create_autopilot_adapter,
     resolve_autopilot_backend,
@@ -50,19 +60,28 @@ load_dotenv(dotenv_path=env_path)
 logger = logging.getLogger("droneserver")
 logger.setLevel(logging.INFO)
 
-# Remove any existing handlers to avoid duplicates
-logger.handlers.clear()
-
-# Single-line format for clean journalctl output
-console_handler = logging.StreamHandler()
-# Compact format: timestamp | level | message (no logger name, no multi-line)
-console_formatter = logging.Formatter('%(asctime)s | %(levelname)-7s | %(message)s', datefmt='%H:%M:%S')
-console_handler.setFormatter(console_formatter)
-logger.addHandler(console_handler)
+# Only attach the handler once so re-imports don't duplicate output
+if not logger.handlers:
+    # Single-line format for clean journalctl output
+    console_handler = logging.StreamHandler()
+    # Compact format: timestamp | level | message (no logger name, no multi-line)
+    console_formatter = logging.Formatter('%(asctime)s | %(levelname)-7s | %(message)s', datefmt='%H:%M:%S')
+    console_handler.setFormatter(console_formatter)
+    # Tools only enqueue records; a listener thread does the stderr writes
+    _log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    _log_listener = logging.handlers.QueueListener(_log_queue, console_handler, respect_handler_level=True)
+    _log_listener.start()
+    # Flush queued records on exit (app_lifespan runs per request in HTTP mode)
+    atexit.register(_log_listener.stop)
 
 # Prevent propagation to avoid duplicate logs from parent loggers
 logger.propagate = False
 
+# Banner separators for startup/status logs
+_SEP = "=" * 60
+_DASH = "-" * 60
+
 # Note: HTTP/framework log suppression is done in droneserver_http.py
 # (must be set right before server start to prevent uvicorn from overriding)
 
@@ -111,12 +130,13 @@ class FlightLogger:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.log_file = self.log_dir / f"flight_{timestamp}.log"
         
-        # Write header
-        with open(self.log_file, 'w') as f:
-            f.write("=" * 80 + "\n")
-            f.write(f"MAVLink MCP Flight Log\n")
-            f.write(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("=" * 80 + "\n\n")
+        # Write header in one shot
+        self.log_file.write_text(
+            "=" * 80 + "\n"
+            "MAVLink MCP Flight Log\n"
+            f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            + "=" * 80 + "\n\n"
+        )
         
         logger.info(f"✈️ Flight log created: {self.log_file}")
     
@@ -141,26 +161,27 @@ def get_flight_logger() -> FlightLogger:
 
 def log_tool_call(tool_name: str, **kwargs):
     """Log MCP tool call with parameters (GREEN) with visual separator"""
-    # Add visual separator before each tool call
-    logger.info(f"{LogColors.SEPARATOR}{'─' * 60}{LogColors.RESET}")
-    
     if kwargs:
         params_str = ", ".join([f"{k}={v}" for k, v in kwargs.items() if v is not None])
         msg = f"{tool_name}({params_str})"
-        logger.info(f"{LogColors.TOOL}🔧 MCP TOOL: {msg}{LogColors.RESET}")
-        # Log input JSON
-        import json
-        logger.info(f"{LogColors.TOOL}📥 INPUT: {json.dumps(kwargs, default=str)}{LogColors.RESET}")
-        get_flight_logger().log_entry("MCP_TOOL", msg)
     else:
         msg = f"{tool_name}()"
+
+    # Console output (and its JSON encoding) only when INFO is enabled
+    if logger.isEnabledFor(logging.INFO):
+        # Add visual separator before each tool call
+        logger.info(f"{LogColors.SEPARATOR}{'─' * 60}{LogColors.RESET}")
         logger.info(f"{LogColors.TOOL}🔧 MCP TOOL: {msg}{LogColors.RESET}")
-        logger.info(f"{LogColors.TOOL}📥 INPUT: {{}}{LogColors.RESET}")
-        get_flight_logger().log_entry("MCP_TOOL", msg)
+        input_json = json.dumps(kwargs, default=str) if kwargs else "{}"
+        logger.info(f"{LogColors.TOOL}📥 INPUT: {input_json}{LogColors.RESET}")
+
+    # The flight log file always records the call
+    get_flight_logger().log_entry("MCP_TOOL", msg)
 
 def log_tool_output(output: dict):
     """Log MCP tool output as JSON (GREEN)"""
-    import json
+    if not logger.isEnabledFor(logging.INFO):
+        return
     logger.info(f"{LogColors.TOOL}📤 OUTPUT: {json.dumps(output, default=str, indent=2)}{LogColors.RESET}")
 
 def log_mavlink_cmd(command: str, **kwargs):
@@ -175,6 +196,22 @@ def log_mavlink_cmd(command: str, **kwargs):
         logger.info(f"{LogColors.MAVLINK}📡 MAVLink → {msg}{LogColors.RESET}")
         get_flight_logger().log_entry("MAVLink_CMD", msg)
 
+def _enum_name(value: object) -> str:
+    """Return the bare member name of a MAVSDK enum (FlightMode.HOLD -> "HOLD"); strings pass through."""
+    name = getattr(value, "name", None)
+    if isinstance(name, str):
+        return name
+    return str(value).rsplit(".", 1)[-1]
+
+def _validate_coordinates(latitude_deg: float, longitude_deg: float) -> dict | None:
+    """Return a failed tool result for out-of-range coordinates, or None if they are valid."""
+    # One compound check on the common (valid) path; error text is only built on failure
+    if -90 <= latitude_deg <= 90 and -180 <= longitude_deg <= 180:
+        return None
+    if not (-90 <= latitude_deg <= 90):
+        return {"status": "failed", "error": f"Invalid latitude: {latitude_deg}. Must be between -90 and 90."}
+    return {"status": "failed", "error": f"Invalid longitude: {longitude_deg}. Must be between -180 and 180."}
+
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate the distance between two GPS coordinates using the Haversine formula.
@@ -348,8 +385,8 @@ def offset_gps(lat: float, lon: float, north_m: float, east_m: float) -> tuple[f
     """Offset a GPS coordinate by meters north and east.
     Uses flat-earth approximation (111320 m/deg). Accurate for <10km offsets.
     """
-    new_lat = lat + north_m / 111320.0
-    new_lon = lon + east_m / (111320.0 * math.cos(math.radians(lat)))
+    new_lat = lat + north_m * _DEG_PER_M_LAT
+    new_lon = lon + east_m * _DEG_PER_M_LAT / math.cos(lat * _DEG2RAD)
     return (new_lat, new_lon)
 
 
@@ -613,7 +650,7 @@ class MissionExecutionRecord:
     mission_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TelemetryCacheEntry:
     """Single cached telemetry value with timestamp."""
     value: object = None
@@ -623,7 +660,7 @@ class TelemetryCacheEntry:
 class TelemetryService:
     """Persistent MAVSDK stream subscriptions with in-memory cache.
 
-    Subscribes to 10 telemetry streams once at startup. Each stream runs in its
+    Subscribes to 11 telemetry streams once at startup. Each stream runs in its
     own asyncio.Task, updating a cache dict on every value. Reads become instant
     dict lookups instead of blocking MAVSDK calls.
     """
@@ -631,15 +668,25 @@ class TelemetryService:
     STREAMS = [
         "position", "battery", "flight_mode", "velocity_ned",
         "landed_state", "heading", "in_air", "armed",
-        "health", "mission_progress",
+        "health", "mission_progress", "status_text",
     ]
     STALE_THRESHOLD_S = 10.0
+    # Max age for values used to build commands (e.g. a goto from "current" position)
+    FRESH_THRESHOLD_S = 1.0
 
     def __init__(self, drone: System):
         self._drone = drone
         self._cache: dict[str, TelemetryCacheEntry] = {
             name: TelemetryCacheEntry() for name in self.STREAMS
         }
+        # Set once each stream has delivered its first value
+        self._ready: dict[str, asyncio.Event] = {
+            name: asyncio.Event() for name in self.STREAMS
+        }
+        # Replaced on every value; waiters hold the old event and are woken by it
+        self._updated: dict[str, asyncio.Event] = {
+            name: asyncio.Event() for name in self.STREAMS
+        }
         self._tasks: dict[str, asyncio.Task] = {}
 
     async def start(self):
@@ -656,6 +703,7 @@ class TelemetryService:
             "armed": self._drone.telemetry.armed,
             "health": self._drone.telemetry.health,
             "mission_progress": self._drone.mission.mission_progress,
+            "status_text": self._drone.telemetry.status_text,
         }
         for name, source_fn in stream_sources.items():
             self._tasks[name] = asyncio.create_task(
@@ -685,6 +733,10 @@ class TelemetryService:
                     self._cache[name] = TelemetryCacheEntry(
                         value=value, updated_at=time.time()
                     )
+                    self._ready[name].set()
+                    updated = self._updated[name]
+                    self._updated[name] = asyncio.Event()
+                    updated.set()
             except asyncio.CancelledError:
                 return
             except Exception as e:
@@ -705,6 +757,41 @@ class TelemetryService:
             )
         return entry.value
 
+    async def wait(self, name: str, timeout: float = 2.0) -> bool:
+        """Wait for a running stream's first value. Returns False on timeout or if not streaming."""
+        ready = self._ready.get(name)
+        if ready is None or name not in self._tasks:
+            return False
+        if ready.is_set():
+            return True
+        try:
+            await asyncio.wait_for(ready.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def is_streaming(self, name: str) -> bool:
+        """True if a background task is subscribed to this stream."""
+        return name in self._tasks
+
+    async def wait_newer(self, name: str, after: float, timeout: float = 5.0) -> TelemetryCacheEntry | None:
+        """Return the cache entry once it was updated after ``after``. None on timeout or if not streaming."""
+        if name not in self._tasks:
+            return None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            entry = self._cache[name]
+            if entry.updated_at > after:
+                return entry
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return None
+            try:
+                await asyncio.wait_for(self._updated[name].wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return None
+
     def get_age(self, name: str) -> float:
         """Seconds since last update for a stream (inf if never received)."""
         entry = self._cache.get(name)
@@ -745,10 +832,10 @@ class TelemetryService:
 
         speed_m_s = None
         if vel:
-            speed_m_s = round(math.sqrt(vel.north_m_s**2 + vel.east_m_s**2), 1)
+            speed_m_s = round(math.hypot(vel.north_m_s, vel.east_m_s), 1)
 
-        flight_mode = str(fm).split(".")[-1] if fm else "UNKNOWN"
-        landed_state = str(ls).split(".")[-1] if ls else "UNKNOWN"
+        flight_mode = _enum_name(fm) if fm else "UNKNOWN"
+        landed_state = _enum_name(ls) if ls else "UNKNOWN"
         is_on_ground = landed_state == "ON_GROUND"
 
         battery_pct = round(bat.remaining_percent, 1) if bat else -1
@@ -774,7 +861,7 @@ class TelemetryService:
         return self._json_safe(snapshot)
 
 
-@dataclass
+@dataclass(slots=True)
 class MAVLinkConnector:
     drone: System
     connection_ready: asyncio.Event = field(default_factory=asyncio.Event)
@@ -794,6 +881,16 @@ class MAVLinkConnector:
     backend_adapter: AutopilotAdapter | None = field(default=None)
     # Current backend-facing mission execution metadata
     current_mission_execution: MissionExecutionRecord | None = field(default=None)
+    # Last IMU stream rate requested via set_rate_imu (None until first get_imu)
+    imu_rate_hz: float | None = field(default=None)
+    # In-flight one-shot telemetry reads, keyed by stream name (see _single_flight)
+    _inflight: dict[str, asyncio.Future] = field(default_factory=dict)
+    # Last get_all_params() result and its time.monotonic() stamp (see list_parameters)
+    _param_cache: tuple[object, float] | None = field(default=None)
+    # Parameter name -> "int" or "float", learned from successful reads and writes
+    _param_types: dict[str, str] = field(default_factory=dict)
+    # Cache timestamp of the last status text returned by print_status_text
+    _status_text_seen_at: float = field(default=0.0)
 
 # Global connector instance - persists across all HTTP requests
 _global_connector: MAVLinkConnector | None = None
@@ -801,6 +898,11 @@ _connection_task: asyncio.Task | None = None
 _connection_lock = asyncio.Lock()
 _lifespan_initialized = False  # Track if lifespan has run (to reduce log noise)
 
+def _get_connector(ctx: Context) -> MAVLinkConnector:
+    """Return the MAVLinkConnector attached to the MCP request lifespan."""
+    return ctx.request_context.lifespan_context
+
+
 async def ensure_connection(connector: MAVLinkConnector, timeout: float = 30.0) -> bool:
     """
     Wait for the drone connection to be ready.
@@ -812,6 +914,9 @@ async def ensure_connection(connector: MAVLinkConnector, timeout: float = 30.0)
     Returns:
         bool: True if connected, False if timeout
     """
+    # Fast path: skip wait_for's timer/future setup once connected
+    if connector.connection_ready.is_set():
+        return True
     try:
         await asyncio.wait_for(connector.connection_ready.wait(), timeout=timeout)
         return True
@@ -820,9 +925,113 @@ async def ensure_connection(connector: MAVLinkConnector, timeout: float = 30.0)
         return False
 
 
+# Result for tools whose connection wait times out; copied per call since results may be mutated
+_CONNECTION_TIMEOUT_RESULT = {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+# Result for backend-routed tools called before the autopilot adapter exists
+_ADAPTER_NOT_INITIALIZED_RESULT = {"status": "failed", "error": "Autopilot adapter not initialized."}
+
+
+def requires_connection(func):
+    """
+    Wait for the drone connection before running an MCP tool.
+
+    Apply beneath @mcp.tool(). functools.wraps keeps the tool's signature and
+    docstring, which FastMCP uses to build the tool schema.
+    """
+    @functools.wraps(func)
+    async def wrapper(ctx: Context, *args, **kwargs):
+        connector = _get_connector(ctx)
+        # Check the event inline so connected calls skip the ensure_connection frame
+        if not connector.connection_ready.is_set() and not await ensure_connection(connector):
+            # The tool body (and its log_tool_call) never runs, so record the call here
+            result = dict(_CONNECTION_TIMEOUT_RESULT)
+            log_tool_call(func.__name__, **kwargs)
+            log_tool_output(result)
+            return result
+        return await func(ctx, *args, **kwargs)
+    return wrapper
+
+
+async def _first_value(stream):
+    """
+    Read a single value from a MAVSDK telemetry stream and close it.
+
+    Closing the generator explicitly releases the underlying gRPC subscription
+    right away instead of leaving it open until the generator is collected.
+
+    Raises:
+        StopAsyncIteration: If the stream ends without yielding a value.
+    """
+    try:
+        return await stream.__anext__()
+    finally:
+        await stream.aclose()
+
+
+async def _read_one(stream):
+    """Like _first_value, but return None if the stream ends without a value."""
+    try:
+        return await _first_value(stream)
+    except StopAsyncIteration:
+        return None
+
+
+# Upper bound for a shared one-shot telemetry read
+SINGLE_FLIGHT_TIMEOUT_S = 5.0
+
+
+async def _single_flight(connector: MAVLinkConnector, key: str, coro_factory):
+    """
+    Share one in-flight read per key between concurrent callers.
+
+    The first caller starts coro_factory(); later callers await the same
+    future until it completes. Waiters are shielded so one caller being
+    cancelled does not cancel the read for the others. The read itself is
+    bounded by SINGLE_FLIGHT_TIMEOUT_S, so a stalled stream releases the key
+    (raising asyncio.TimeoutError) instead of holding it for later callers.
+    """
+    fut = connector._inflight.get(key)
+    if fut is None:
+        fut = asyncio.ensure_future(asyncio.wait_for(coro_factory(), timeout=SINGLE_FLIGHT_TIMEOUT_S))
+        connector._inflight[key] = fut
+        fut.add_done_callback(lambda _: connector._inflight.pop(key, None))
+    return await asyncio.shield(fut)
+
+
+async def _read_telemetry_aged(connector: MAVLinkConnector, name: str, stream_fn) -> tuple[object, float]:
+    """
+    Return the latest value for a telemetry stream and its age in seconds.
+
+    Serves from the TelemetryService cache when it holds a fresh value. If
+    the stream is running but has not delivered yet, waits briefly for its
+    first value. Only falls back to a one-shot MAVSDK subscription otherwise
+    (age 0.0); concurrent fallback reads of the same stream share one
+    subscription.
+    """
+    telemetry = connector.telemetry
+    if telemetry is not None:
+        age = telemetry.get_age(name)
+        if age <= telemetry.STALE_THRESHOLD_S:
+            return telemetry.get(name), age
+        if math.isinf(age) and await telemetry.wait(name):
+            return telemetry.get(name), telemetry.get_age(name)
+    value = await _single_flight(connector, name, lambda: _first_value(stream_fn()))
+    return value, 0.0
+
+
+async def _read_telemetry(connector: MAVLinkConnector, name: str, stream_fn):
+    """Return the latest value for a telemetry stream (see _read_telemetry_aged)."""
+    value, _ = await _read_telemetry_aged(connector, name, stream_fn)
+    return value
+
+
 MISSION_ACTIVITY_TYPES = {"waypoint_route", "orbit", "search"}
 MISSION_FLIGHT_MODES = {"MISSION", "AUTO", "AUTO_MISSION"}
 TERMINAL_RETURN_MODES = {"RETURN_TO_LAUNCH", "LAND"}
+SUPPORTED_FLIGHT_MODES = frozenset({"HOLD", "LOITER", "RTL", "RETURN_TO_LAUNCH", "LAND", "GUIDED"})
+MAVLINK_PROTOCOLS = frozenset({"tcp", "udp", "serial"})
+# Flight mode updates arrive at ~1 Hz (heartbeat rate); allow more than one period
+FLIGHT_MODE_CONFIRM_TIMEOUT_S = 1.5
 
 
 def _runtime_id(prefix: str) -> str:
@@ -836,10 +1045,45 @@ def _is_mission_activity(activity: FlightActivity | None) -> bool:
 def _normalize_flight_mode(value: object) -> str:
     if value is None:
         return "UNKNOWN"
-    mode = str(value).split(".")[-1]
+    mode = _enum_name(value)
     return mode.upper()
 
 
+async def _wait_for_flight_mode(
+    drone: System,
+    expected: set[str],
+    previous: str | None = None,
+    timeout: float = FLIGHT_MODE_CONFIRM_TIMEOUT_S,
+):
+    """
+    Watch the flight mode stream until it reports one of ``expected``.
+
+    With an empty ``expected`` the wait ends on the first mode that differs
+    from ``previous`` (the mode before the command), or on the first reading
+    if ``previous`` is unknown. Gives up after ``timeout`` seconds and returns
+    the last mode seen (None if the stream produced nothing).
+    """
+    last_mode = None
+
+    async def _watch():
+        nonlocal last_mode
+        async with aclosing(drone.telemetry.flight_mode()) as modes:
+            async for mode in modes:
+                last_mode = mode
+                normalized = _normalize_flight_mode(mode)
+                if expected:
+                    if normalized in expected:
+                        return
+                elif previous is None or normalized != previous:
+                    return
+
+    try:
+        await asyncio.wait_for(_watch(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+    return last_mode
+
+
 def _progress_has_advanced(start: dict[str, int] | None, current: dict[str, int] | None) -> bool:
     if not start or not current:
         return False
@@ -991,11 +1235,6 @@ async def _read_runtime_observation(connector: MAVLinkConnector) -> dict[str, An
             "mission_progress": snapshot.get("mission_progress", {"current": 0, "total": 0}),
         }
 
-    async def _read_one(aiter, timeout=5.0):
-        async for item in aiter:
-            return item
-        return None
-
     telemetry: dict[str, Any] = {}
     position = None
     speed_m_s = None
@@ -1028,7 +1267,7 @@ async def _read_runtime_observation(connector: MAVLinkConnector) -> dict[str, An
     try:
         vel = await asyncio.wait_for(_read_one(drone.telemetry.velocity_ned()), timeout=5.0)
         if vel:
-            speed_m_s = round(math.sqrt(vel.north_m_s**2 + vel.east_m_s**2), 1)
+            speed_m_s = round(math.hypot(vel.north_m_s, vel.east_m_s), 1)
     except asyncio.TimeoutError:
         pass
     telemetry["speed_m_s"] = speed_m_s
@@ -1171,6 +1410,20 @@ async def validate_raw_mission_start(
     }
 
 
+_NAN = float("nan")
+
+# Required per-waypoint fields, read in one call as (latitude, longitude, altitude).
+_LEGACY_WAYPOINT_REQUIRED = ("latitude_deg", "longitude_deg", "relative_altitude_m")
+_legacy_waypoint_position = operator.itemgetter(*_LEGACY_WAYPOINT_REQUIRED)
+
+# Optional per-waypoint fields accepted by initiate_mission/upload_mission.
+_LEGACY_WAYPOINT_DEFAULTS = {
+    "loiter_time_s": 0.0,
+    "acceptance_radius_m": 2.0,
+    "yaw_deg": _NAN,
+}
+
+
 def build_raw_mission(
     nav_waypoints: list[dict[str, float]],
     *,
@@ -1210,7 +1463,7 @@ def build_raw_mission(
             param1=0,
             param2=acceptance_radius_m,
             param3=0,
-            param4=float("nan"),
+            param4=_NAN,
             x=int(wp["latitude_deg"] * 1e7),
             y=int(wp["longitude_deg"] * 1e7),
             z=float(wp["relative_altitude_m"]),
@@ -1365,14 +1618,12 @@ def _build_legacy_mission_raw_items(
     for i, point in enumerate(mission_points):
         if not isinstance(point, dict):
             raise ValueError(f"Mission point {i} must be a dictionary.")
-        if "latitude_deg" not in point or "longitude_deg" not in point or "relative_altitude_m" not in point:
+        try:
+            latitude, longitude, altitude = _legacy_waypoint_position(point)
+        except KeyError:
             raise ValueError(
-                f"Mission point {i} missing required fields. Required: latitude_deg, longitude_deg, relative_altitude_m."
-            )
-
-        latitude = point["latitude_deg"]
-        longitude = point["longitude_deg"]
-        altitude = point["relative_altitude_m"]
+                f"Mission point {i} missing required fields. Required: {', '.join(_LEGACY_WAYPOINT_REQUIRED)}."
+            ) from None
 
         if not (-90 <= latitude <= 90):
             raise ValueError(f"Invalid latitude_deg for mission point {i}: {latitude}. Must be between -90 and 90.")
@@ -1381,16 +1632,17 @@ def _build_legacy_mission_raw_items(
         if altitude < 0:
             raise ValueError(f"Invalid relative_altitude_m for mission point {i}: {altitude}. Must be non-negative.")
 
+        waypoint = {**_LEGACY_WAYPOINT_DEFAULTS, **point}
         mission_items.append(MissionItem(
             seq=len(mission_items),
             frame=3,
             command=16,
             current=1 if i == 0 else 0,
             autocontinue=1,
-            param1=float(point.get("loiter_time_s", 0.0)),
-            param2=float(point.get("acceptance_radius_m", 2.0)),
+            param1=float(waypoint["loiter_time_s"]),
+            param2=float(waypoint["acceptance_radius_m"]),
             param3=0.0,
-            param4=float(point.get("yaw_deg", float("nan"))),
+            param4=float(waypoint["yaw_deg"]),
             x=int(latitude * 1e7),
             y=int(longitude * 1e7),
             z=float(altitude),
@@ -1507,6 +1759,22 @@ async def start_existing_mission_execution(
 
     return validation
 
+async def _wait_for_gps_lock(drone: System) -> bool:
+    """Wait until health reports a global or home position. Returns False if the stream ends first."""
+    async with aclosing(drone.telemetry.health()) as health_updates:
+        async for health in health_updates:
+            if health.is_global_position_ok or health.is_home_position_ok:
+                logger.info(_SEP)
+                logger.info(
+                    "✓ GPS LOCK ACQUIRED (global position: %s, home position: %s)",
+                    "OK" if health.is_global_position_ok else "Not ready",
+                    "OK" if health.is_home_position_ok else "Not ready",
+                )
+                logger.info(_SEP)
+                return True
+    return False
+
+
 async def connect_drone_background(connector: MAVLinkConnector, address: str, port: str, protocol: str):
     """Connect to drone in the background without blocking server startup.
 
@@ -1514,50 +1782,53 @@ async def connect_drone_background(connector: MAVLinkConnector, address: str, po
     """
     drone = connector.drone
     connection_string = f"{protocol}://{address}:{port}"
-    logger.info("Background: Connecting to drone...")
-    logger.info("  Protocol: %s", protocol.upper())
-    logger.info("  Target: %s:%s", address, port)
+    logger.info("Background: Connecting to drone via %s at %s:%s...", protocol.upper(), address, port)
 
     await drone.connect(system_address=connection_string)
 
-    logger.info("Background: Waiting for drone to respond...")
-    async for state in drone.core.connection_state():
-        if state.is_connected:
-            logger.info("=" * 60)
-            logger.info("✓ SUCCESS: Connected to drone at %s:%s!", address, port)
-            logger.info("=" * 60)
-            break
+    # Subscribe to health right away so GPS status streams in while the link comes up
+    gps_lock = asyncio.create_task(_wait_for_gps_lock(drone), name="gps-lock-wait")
+    try:
+        logger.info("Background: Waiting for drone to respond...")
+        async with aclosing(drone.core.connection_state()) as states:
+            async for state in states:
+                if state.is_connected:
+                    logger.info(_SEP)
+                    logger.info("✓ SUCCESS: Connected to drone at %s:%s!", address, port)
+                    logger.info(_SEP)
+                    break
 
-    logger.info("Background: Waiting for GPS lock...")
-    async for health in drone.telemetry.health():
-        if health.is_global_position_ok or health.is_home_position_ok:
-            logger.info("=" * 60)
-            logger.info("✓ GPS LOCK ACQUIRED")
-            logger.info("  Global position: %s", "OK" if health.is_global_position_ok else "Not ready")
-            logger.info("  Home position: %s", "OK" if health.is_home_position_ok else "Not ready")
-            logger.info("=" * 60)
-            # Start TelemetryService now that MAVSDK streams are available
-            if connector.telemetry:
-                await connector.telemetry.start()
-            logger.info("Drone is READY for commands")
-            logger.info("=" * 60)
-            # Signal that connection is ready!
-            connector.connection_ready.set()
-            break
+        logger.info("Background: Waiting for GPS lock...")
+        if not await gps_lock:
+            return
+    finally:
+        gps_lock.cancel()
+
+    # Start TelemetryService now that MAVSDK streams are available
+    if connector.telemetry:
+        await connector.telemetry.start()
+    logger.info("Drone is READY for commands")
+    logger.info(_SEP)
+    # Signal that connection is ready!
+    connector.connection_ready.set()
 
 
 async def get_or_create_global_connector() -> MAVLinkConnector:
     """Get or create the global drone connector (thread-safe)"""
     global _global_connector, _connection_task
-    
+
+    # Fast path: skip the lock once the connector exists
+    if _global_connector is not None:
+        return _global_connector
+
     async with _connection_lock:
         if _global_connector is not None:
             return _global_connector
         
         # Initialize for the first time
-        logger.info("=" * 60)
+        logger.info(_SEP)
         logger.info("MAVLink MCP Server - Initializing Global Drone Connection")
-        logger.info("=" * 60)
+        logger.info(_SEP)
         
         # Read connection settings from environment (.env file)
         address = os.environ.get("MAVLINK_ADDRESS", "")
@@ -1566,12 +1837,12 @@ async def get_or_create_global_connector() -> MAVLinkConnector:
         autopilot_backend = resolve_autopilot_backend(os.environ.get("AUTOPILOT_BACKEND"))
         
         # Display connection configuration
-        logger.info("Configuration loaded from .env file:")
-        logger.info("  MAVLINK_ADDRESS: %s", address if address else "(not set)")
-        logger.info("  MAVLINK_PORT: %s", port)
-        logger.info("  MAVLINK_PROTOCOL: %s", protocol)
-        logger.info("  AUTOPILOT_BACKEND: %s", autopilot_backend)
-        logger.info("=" * 60)
+        logger.info(
+            "Configuration loaded from .env file: MAVLINK_ADDRESS=%s MAVLINK_PORT=%s "
+            "MAVLINK_PROTOCOL=%s AUTOPILOT_BACKEND=%s",
+            address if address else "(not set)", port, protocol, autopilot_backend,
+        )
+        logger.info(_SEP)
         
         # Empty or 0.0.0.0 address = MAVSDK listen mode (udp://:PORT)
         # This is needed when PX4 SITL sends heartbeats TO droneserver
@@ -1580,7 +1851,7 @@ async def get_or_create_global_connector() -> MAVLinkConnector:
             logger.info("  Listen mode: will accept connections on port %s", port)
         
         # Validate protocol
-        if protocol not in ["tcp", "udp", "serial"]:
+        if protocol not in MAVLINK_PROTOCOLS:
             logger.warning("Invalid protocol '%s', defaulting to udp", protocol)
             protocol = "udp"
         
@@ -1590,21 +1861,21 @@ async def get_or_create_global_connector() -> MAVLinkConnector:
         # Create the global connector with TelemetryService
         # Vision/camera functionality is now in perception-service (PERCEPTION_URL env var)
         perception_url = os.environ.get("PERCEPTION_URL", "http://localhost:8090")
-        logger.info(f"Perception service URL: {perception_url}")
+        logger.info("Perception service URL: %s", perception_url)
 
+        telemetry = TelemetryService(drone)
         _global_connector = MAVLinkConnector(
             drone=drone,
             connection_ready=connection_ready,
-            telemetry=TelemetryService(drone),
+            telemetry=telemetry,
             perception_url=perception_url,
             autopilot_backend=autopilot_backend,
-            backend_adapter=create_autopilot_adapter(drone, autopilot_backend),
+            backend_adapter=create_autopilot_adapter(drone, autopilot_backend, telemetry),
         )
 
         # Start drone connection in background
-        logger.info("Starting persistent drone connection in background...")
-        logger.info("This connection will be shared across all requests")
-        logger.info("-" * 60)
+        logger.info("Starting persistent drone connection in background (shared across all requests)...")
+        logger.info(_DASH)
 
         _connection_task = asyncio.create_task(
             connect_drone_background(_global_connector, address, port, protocol)
@@ -1623,15 +1894,10 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[MAVLinkConnector]:
     
     # Only log on first initialization to avoid spam
     if not _lifespan_initialized:
-        logger.info("=" * 60)
-        logger.info("🚀 LIFESPAN: Starting application lifespan...")
-        logger.info("=" * 60)
+        logger.info("🚀 LIFESPAN: Starting application lifespan - calling get_or_create_global_connector()...")
     
     try:
         # Get or create the global connector (only happens once)
-        if not _lifespan_initialized:
-            logger.info("LIFESPAN: Calling get_or_create_global_connector()...")
-        
         connector = await get_or_create_global_connector()
         
         if not _lifespan_initialized:
@@ -1660,9 +1926,9 @@ async def initialize_drone_connection():
     Initialize the global drone connection.
     Call this from droneserver_http.py after the server starts.
     """
-    logger.info("=" * 60)
+    logger.info(_SEP)
     logger.info("🚀 STARTUP: Initializing drone connection...")
-    logger.info("=" * 60)
+    logger.info(_SEP)
     try:
         await get_or_create_global_connector()
         logger.info("✓ Drone connection initialization complete!")
@@ -1670,16 +1936,42 @@ async def initialize_drone_connection():
         logger.error("❌ Failed to initialize drone connection: %s", str(e), exc_info=True)
 
 
+async def shutdown_drone_connection(timeout: float = 5.0):
+    """
+    Stop the background connection task and telemetry streams.
+    Call this from droneserver_http.py when the server shuts down.
+
+    Each step is bounded by ``timeout`` so a MAVSDK call that ignores
+    cancellation cannot hang process exit.
+    """
+    global _connection_task
+
+    task = _connection_task
+    _connection_task = None
+    if task is not None and not task.done():
+        task.cancel()
+        try:
+            await asyncio.wait_for(asyncio.shield(task), timeout=timeout)
+        except asyncio.CancelledError:
+            pass
+        except asyncio.TimeoutError:
+            logger.warning("SHUTDOWN: Drone connection task did not exit within %ss", timeout)
+
+    connector = _global_connector
+    if connector is not None and connector.telemetry:
+        try:
+            await asyncio.wait_for(connector.telemetry.stop(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning("SHUTDOWN: TelemetryService did not stop within %ss", timeout)
+
+
 # ARM
 @mcp.tool()
+@requires_connection
 async def arm_drone(ctx: Context) -> dict:
     """Arm the drone. Waits for drone connection if not yet ready."""
     log_tool_call("arm_drone")
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     log_mavlink_cmd("drone.action.arm")
@@ -1689,6 +1981,7 @@ async def arm_drone(ctx: Context) -> dict:
 
 # Get Position
 @mcp.tool()
+@requires_connection
 async def get_position(ctx: Context) -> dict:
     """
     Get the position of the drone in latitude/longitude degrees and altitude in meters.
@@ -1702,30 +1995,29 @@ async def get_position(ctx: Context) -> dict:
         dict: A dict with the position or error status.
     """
     log_tool_call("get_position")
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     logger.info("Fetching drone position")
 
     try:
-        async for position in drone.telemetry.position():
-            result = {"status": "success", "position": {
-                "latitude_deg": position.latitude_deg,
-                "longitude_deg": position.longitude_deg,
-                "absolute_altitude_m": position.absolute_altitude_m,
-                "relative_altitude_m": position.relative_altitude_m
-            }}
-            log_tool_output(result)
-            return result
+        position = await _read_telemetry(connector, "position", drone.telemetry.position)
+        result = {"status": "success", "position": {
+            "latitude_deg": position.latitude_deg,
+            "longitude_deg": position.longitude_deg,
+            "absolute_altitude_m": position.absolute_altitude_m,
+            "relative_altitude_m": position.relative_altitude_m
+        }}
+        log_tool_output(result)
+        return result
+    except StopAsyncIteration:
+        return {"status": "failed", "error": "Position stream ended without data"}
     except Exception as e:
-        logger.error(f"{LogColors.ERROR}❌ TOOL ERROR - Failed to retrieve position: {e}{LogColors.RESET}")
+        logger.error("%s❌ TOOL ERROR - Failed to retrieve position: %s%s", LogColors.ERROR, e, LogColors.RESET)
         return {"status": "failed", "error": str(e)}
 
 @mcp.tool()
+@requires_connection
 async def move_to_relative(ctx: Context, north_m: float, east_m: float, down_m: float, yaw_deg: float = 0.0) -> dict:
     """
     Move the drone relative to the current position using backend-specific navigation control.
@@ -1743,22 +2035,18 @@ async def move_to_relative(ctx: Context, north_m: float, east_m: float, down_m:
         dict: Status message with success or error.
     """
     log_tool_call("move_to_relative", north_m=north_m, east_m=east_m, down_m=down_m, yaw_deg=yaw_deg)
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     try:
         adapter = connector.backend_adapter
         if adapter is None:
-            return {"status": "failed", "error": "Autopilot adapter not initialized."}
+            return dict(_ADAPTER_NOT_INITIALIZED_RESULT)
 
         movement = await adapter.move_to_relative(north_m, east_m, down_m, yaw_deg)
         current_position = movement.get("current_position", {})
         target_position = movement.get("target_position", {})
 
-        logger.info(f"Relative move via backend={connector.autopilot_backend}")
+        logger.info("Relative move via backend=%s", connector.autopilot_backend)
         if current_position:
             logger.info(
                 "  Current: %.6f°, %.6f° @ %.1fm MSL",
@@ -1766,7 +2054,7 @@ async def move_to_relative(ctx: Context, north_m: float, east_m: float, down_m:
                 current_position["longitude_deg"],
                 current_position["absolute_altitude_m"],
             )
-        logger.info(f"  Offset: north={north_m:.1f}m, east={east_m:.1f}m, down={down_m:.1f}m")
+        logger.info("  Offset: north=%.1fm, east=%.1fm, down=%.1fm", north_m, east_m, down_m)
         if target_position:
             logger.info(
                 "  Target: %.6f°, %.6f° @ %.1fm MSL",
@@ -1775,7 +2063,7 @@ async def move_to_relative(ctx: Context, north_m: float, east_m: float, down_m:
                 target_position["altitude_m"],
             )
 
-        distance_m = math.sqrt(north_m**2 + east_m**2 + down_m**2)
+        distance_m = math.hypot(north_m, east_m, down_m)
         begin_activity(
             connector,
             activity_type="relative_move",
@@ -1811,10 +2099,11 @@ async def move_to_relative(ctx: Context, north_m: float, east_m: float, down_m:
         return result
         
     except Exception as e:
-        logger.error(f"{LogColors.ERROR}❌ TOOL ERROR - Failed to execute relative movement: {e}{LogColors.RESET}")
+        logger.error("%s❌ TOOL ERROR - Failed to execute relative movement: %s%s", LogColors.ERROR, e, LogColors.RESET)
         return {"status": "failed", "error": f"Movement failed: {str(e)}"}
 
 @mcp.tool()
+@requires_connection
 async def takeoff(ctx: Context, takeoff_altitude: float = 3.0, wait_for_altitude: bool = True) -> dict:
     """Command the drone to initiate takeoff and ascend to a specified altitude. 
     The drone must be armed. Waits for connection if not ready.
@@ -1834,11 +2123,7 @@ async def takeoff(ctx: Context, takeoff_altitude: float = 3.0, wait_for_altitude
         dict: Status message with success or error, including final altitude reached.
     """
     log_tool_call("takeoff", takeoff_altitude=takeoff_altitude, wait_for_altitude=wait_for_altitude)
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     logger.info(f"Taking off to {takeoff_altitude}m AGL (relative altitude)")
@@ -1875,28 +2160,27 @@ async def takeoff(ctx: Context, takeoff_altitude: float = 3.0, wait_for_altitude
     
     while elapsed_time < max_wait_time:
         try:
-            async for position in drone.telemetry.position():
-                current_alt = position.relative_altitude_m
-                logger.info(f"  Altitude: {current_alt:.1f}m / {takeoff_altitude}m")
-                
-                if current_alt >= (takeoff_altitude - altitude_threshold):
-                    transition_activity(
-                        connector,
-                        status="completed",
-                        reason="Reached takeoff target altitude.",
-                        evidence={"reached_altitude_m": round(current_alt, 1)},
-                    )
-                    logger.info(f"{LogColors.SUCCESS}✅ Takeoff complete - reached {current_alt:.1f}m{LogColors.RESET}")
-                    result = {
-                        "status": "success",
-                        "message": f"Takeoff complete - drone at {current_alt:.1f}m AGL",
-                        "altitude_reached_m": round(current_alt, 1),
-                        "target_altitude_m": takeoff_altitude,
-                        "safe_to_navigate": True
-                    }
-                    log_tool_output(result)
-                    return result
-                break  # Got one position reading, wait and try again
+            position = await _first_value(drone.telemetry.position())
+            current_alt = position.relative_altitude_m
+            logger.info(f"  Altitude: {current_alt:.1f}m / {takeoff_altitude}m")
+            
+            if current_alt >= (takeoff_altitude - altitude_threshold):
+                transition_activity(
+                    connector,
+                    status="completed",
+                    reason="Reached takeoff target altitude.",
+                    evidence={"reached_altitude_m": round(current_alt, 1)},
+                )
+                logger.info(f"{LogColors.SUCCESS}✅ Takeoff complete - reached {current_alt:.1f}m{LogColors.RESET}")
+                result = {
+                    "status": "success",
+                    "message": f"Takeoff complete - drone at {current_alt:.1f}m AGL",
+                    "altitude_reached_m": round(current_alt, 1),
+                    "target_altitude_m": takeoff_altitude,
+                    "safe_to_navigate": True
+                }
+                log_tool_output(result)
+                return result
         except Exception as e:
             logger.warning(f"Error reading altitude: {e}")
         
@@ -1905,9 +2189,8 @@ async def takeoff(ctx: Context, takeoff_altitude: float = 3.0, wait_for_altitude
     
     # Timeout - get final altitude
     try:
-        async for position in drone.telemetry.position():
-            current_alt = position.relative_altitude_m
-            break
+        position = await _first_value(drone.telemetry.position())
+        current_alt = position.relative_altitude_m
     except:
         current_alt = 0
     
@@ -1928,6 +2211,7 @@ async def takeoff(ctx: Context, takeoff_altitude: float = 3.0, wait_for_altitude
     }
 
 @mcp.tool()
+@requires_connection
 async def land(ctx: Context, force: bool = False) -> dict:
     """Command the drone to initiate landing at its current location.
     
@@ -1945,11 +2229,7 @@ async def land(ctx: Context, force: bool = False) -> dict:
         dict: Status message with success, blocked, or error.
     """
     log_tool_call("land", force=force)
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
 
@@ -1958,7 +2238,7 @@ async def land(ctx: Context, force: bool = False) -> dict:
         current_fm = None
         if connector.telemetry:
             fm_obj = connector.telemetry.get("flight_mode")
-            current_fm = str(fm_obj).split(".")[-1] if fm_obj else None
+            current_fm = _enum_name(fm_obj) if fm_obj else None
         if current_fm in ("RETURN_TO_LAUNCH", "LAND"):
             result = {
                 "status": "blocked",
@@ -1977,10 +2257,9 @@ async def land(ctx: Context, force: bool = False) -> dict:
         
         # Get current position
         try:
-            async for position in drone.telemetry.position():
-                current_lat = position.latitude_deg
-                current_lon = position.longitude_deg
-                break
+            position = await _first_value(drone.telemetry.position())
+            current_lat = position.latitude_deg
+            current_lon = position.longitude_deg
             
             distance = haversine_distance(current_lat, current_lon, dest_lat, dest_lon)
             
@@ -2050,23 +2329,34 @@ async def land(ctx: Context, force: bool = False) -> dict:
     return result
 
 @mcp.tool()
+@requires_connection
 async def print_status_text(ctx: Context) -> dict:
     """Print and return status text from the drone. Waits for connection if not ready."""
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
+    telemetry = connector.telemetry
     try:
-        async for status_text in drone.telemetry.status_text():
-            logger.info(f"Status: {status_text.type}: {status_text.text}")
-            return {"status": "success", "type": status_text.type, "text": status_text.text}
-    except asyncio.CancelledError:
+        if telemetry is not None and telemetry.is_streaming("status_text"):
+            # Status text is sporadic: return a recent text not yet returned,
+            # otherwise wait for the service's next one
+            after = max(connector._status_text_seen_at, time.time() - telemetry.STALE_THRESHOLD_S)
+            entry = await telemetry.wait_newer("status_text", after, timeout=5.0)
+            if entry is None:
+                return {"status": "failed", "error": "No status text received within 5s"}
+            connector._status_text_seen_at = entry.updated_at
+            status_text = entry.value
+        else:
+            status_text = await asyncio.wait_for(_first_value(drone.telemetry.status_text()), timeout=5.0)
+        logger.info("Status: %s: %s", status_text.type, status_text.text)
+        return {"status": "success", "type": status_text.type, "text": status_text.text}
+    except asyncio.TimeoutError:
+        return {"status": "failed", "error": "No status text received within 5s"}
+    except (StopAsyncIteration, asyncio.CancelledError):
         return {"status": "failed", "error": "Failed to retrieve status text"}
 
 @mcp.tool()
+@requires_connection
 async def get_imu(ctx: Context, n: int = 1) -> dict:
     """Fetch the first n IMU data points from the drone. Waits for connection if not ready.
 
@@ -2077,48 +2367,51 @@ async def get_imu(ctx: Context, n: int = 1) -> dict:
     Returns:
         dict: A dict with status and list of IMU data points.
     """
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     telemetry = drone.telemetry
 
-    # Set the rate at which IMU data is updated (in Hz)
-    await telemetry.set_rate_imu(200.0)
+    # Set the rate at which IMU data is updated (in Hz), only once per session
+    if connector.imu_rate_hz != 200.0:
+        await telemetry.set_rate_imu(200.0)
+        connector.imu_rate_hz = 200.0
 
     imu_data = []
     count = 0
 
-    async for imu in telemetry.imu():
-        imu_data.append({
-            "timestamp_us": imu.timestamp_us,
-            "acceleration": {
-                "x": imu.acceleration_frd.forward_m_s2,
-                "y": imu.acceleration_frd.right_m_s2,
-                "z": imu.acceleration_frd.down_m_s2
-            },
-            "angular_velocity": {
-                "x": imu.angular_velocity_frd.forward_rad_s,
-                "y": imu.angular_velocity_frd.right_rad_s,
-                "z": imu.angular_velocity_frd.down_rad_s
-            },
-            "magnetic_field": {
-                "x": imu.magnetic_field_frd.forward_gauss,
-                "y": imu.magnetic_field_frd.right_gauss,
-                "z": imu.magnetic_field_frd.down_gauss
-            },
-            "temperature_degc": imu.temperature_degc
-        })
-        count += 1
-        if count >= n:
-            break
+    async with aclosing(telemetry.imu()) as imu_stream:
+        async for imu in imu_stream:
+            a = imu.acceleration_frd
+            w = imu.angular_velocity_frd
+            m = imu.magnetic_field_frd
+            imu_data.append({
+                "timestamp_us": imu.timestamp_us,
+                "acceleration": {
+                    "x": a.forward_m_s2,
+                    "y": a.right_m_s2,
+                    "z": a.down_m_s2
+                },
+                "angular_velocity": {
+                    "x": w.forward_rad_s,
+                    "y": w.right_rad_s,
+                    "z": w.down_rad_s
+                },
+                "magnetic_field": {
+                    "x": m.forward_gauss,
+                    "y": m.right_gauss,
+                    "z": m.down_gauss
+                },
+                "temperature_degc": imu.temperature_degc
+            })
+            count += 1
+            if count >= n:
+                break
 
     return {"status": "success", "imu_data": imu_data, "count": len(imu_data)}
 
 @mcp.tool()
+@requires_connection
 async def print_mission_progress(ctx: Context) -> dict:
     """
     Print and return the current mission progress of the drone. Waits for connection if not ready.
@@ -2129,20 +2422,22 @@ async def print_mission_progress(ctx: Context) -> dict:
     Returns:
         dict: A dictionary containing the current and total mission progress or error status.
     """
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
-    async for mission_progress in drone.mission.mission_progress():
-        logger.info(f"Mission progress: {mission_progress.current}/{mission_progress.total}")
-        return {"status": "success", "current": mission_progress.current, "total": mission_progress.total}
+    try:
+        mission_progress = await _read_telemetry(connector, "mission_progress", drone.mission.mission_progress)
+    except StopAsyncIteration:
+        return {"status": "failed", "error": "Mission progress stream ended without data"}
+    except asyncio.TimeoutError:
+        return {"status": "failed", "error": f"No mission progress received within {SINGLE_FLIGHT_TIMEOUT_S:.0f}s"}
+    logger.info("Mission progress: %s/%s", mission_progress.current, mission_progress.total)
+    return {"status": "success", "current": mission_progress.current, "total": mission_progress.total}
 
 
 
 @mcp.tool()
+@requires_connection
 async def initiate_mission(ctx: Context, mission_points: list, return_to_launch: bool = True) -> dict:
     """
     Initiate a mission with a list of mission points. The drone must be armed. Waits for connection if not ready.
@@ -2170,11 +2465,7 @@ async def initiate_mission(ctx: Context, mission_points: list, return_to_launch:
         dict: Status message with success or error.
     """
     log_tool_call("initiate_mission", waypoint_count=len(mission_points), return_to_launch=return_to_launch)
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     try:
         mission_items, execution = _build_legacy_mission_raw_items(
@@ -2239,10 +2530,10 @@ async def initiate_mission(ctx: Context, mission_points: list, return_to_launch:
 async def get_backend_info(ctx: Context) -> dict:
     """Get the configured autopilot backend and its control capabilities."""
     log_tool_call("get_backend_info")
-    connector = ctx.request_context.lifespan_context
+    connector = _get_connector(ctx)
     adapter = connector.backend_adapter
     if adapter is None:
-        return {"status": "failed", "error": "Autopilot adapter not initialized."}
+        return dict(_ADAPTER_NOT_INITIALIZED_RESULT)
 
     result = {
         "status": "success",
@@ -2253,6 +2544,7 @@ async def get_backend_info(ctx: Context) -> dict:
     return result
 
 @mcp.tool()
+@requires_connection
 async def get_flight_mode(ctx: Context) -> dict:
     """
     Get the current flight mode of the drone. Waits for connection if not ready.
@@ -2263,22 +2555,19 @@ async def get_flight_mode(ctx: Context) -> dict:
     Returns:
         dict: The current flight mode of the drone or error status.
     """
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     try:
-        flight_mode = await drone.telemetry.flight_mode().__anext__()
-        logger.info(f"FlightMode: {flight_mode}")
-        return {"status": "success", "flight_mode": str(flight_mode)}
-    except StopAsyncIteration:
-        logger.error(f"{LogColors.ERROR}❌ TOOL ERROR - Failed to retrieve flight mode{LogColors.RESET}")
+        flight_mode = await _read_telemetry(connector, "flight_mode", drone.telemetry.flight_mode)
+        logger.info("FlightMode: %s", flight_mode)
+        return {"status": "success", "flight_mode": _enum_name(flight_mode)}
+    except (StopAsyncIteration, asyncio.TimeoutError):
+        logger.error("%s❌ TOOL ERROR - Failed to retrieve flight mode%s", LogColors.ERROR, LogColors.RESET)
         return {"status": "failed", "error": "Failed to retrieve flight mode"}
 
 @mcp.tool()
+@requires_connection
 async def set_flight_mode(ctx: Context, mode: str) -> dict:
     """
     Set the flight mode of the drone.
@@ -2300,17 +2589,11 @@ async def set_flight_mode(ctx: Context, mode: str) -> dict:
         dict: Status message with the new flight mode or error.
     """
     log_tool_call("set_flight_mode", mode=mode)
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     mode_upper = mode.upper().strip()
     
-    supported_modes = {"HOLD", "LOITER", "RTL", "RETURN_TO_LAUNCH", "LAND", "GUIDED"}
-    
-    if mode_upper not in supported_modes:
+    if mode_upper not in SUPPORTED_FLIGHT_MODES:
         return {
             "status": "failed", 
             "error": f"Unsupported mode: {mode}. Supported modes: HOLD, RTL, LAND, GUIDED",
@@ -2320,15 +2603,24 @@ async def set_flight_mode(ctx: Context, mode: str) -> dict:
     try:
         adapter = connector.backend_adapter
         if adapter is None:
-            return {"status": "failed", "error": "Autopilot adapter not initialized."}
+            return dict(_ADAPTER_NOT_INITIALIZED_RESULT)
+
+        telemetry = connector.telemetry
+        previous_mode = telemetry.get("flight_mode") if telemetry is not None else None
+        previous_mode = _normalize_flight_mode(previous_mode) if previous_mode is not None else None
 
         mode_result = await adapter.set_flight_mode(mode_upper)
         
-        # Verify mode changed
-        await asyncio.sleep(0.5)
+        # Verify mode changed: return as soon as telemetry reports one of the
+        # modes the adapter expects (max 1.5s). Nothing to wait for if the
+        # adapter sent no command.
         try:
-            new_mode = await connector.drone.telemetry.flight_mode().__anext__()
-            actual_mode = str(new_mode)
+            if mode_result.get("adapter_action") == "none":
+                actual_mode = previous_mode or "UNKNOWN"
+            else:
+                expected = mode_result.get("expected_modes", set())
+                new_mode = await _wait_for_flight_mode(connector.drone, expected, previous_mode)
+                actual_mode = str(new_mode) if new_mode is not None else "UNKNOWN"
         except Exception:
             actual_mode = "UNKNOWN"
         
@@ -2359,6 +2651,7 @@ async def set_flight_mode(ctx: Context, mode: str) -> dict:
 # ============================================================================
 
 @mcp.tool()
+@requires_connection
 async def disarm_drone(ctx: Context) -> dict:
     """
     Disarm the drone motors. This stops the motors from spinning.
@@ -2372,11 +2665,7 @@ async def disarm_drone(ctx: Context) -> dict:
         dict: Status message with success or error.
     """
     log_tool_call("disarm_drone")
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     logger.info("Disarming drone")
@@ -2390,6 +2679,7 @@ async def disarm_drone(ctx: Context) -> dict:
         return {"status": "failed", "error": f"Disarm failed: {str(e)}"}
 
 @mcp.tool()
+@requires_connection
 async def return_to_launch(ctx: Context) -> dict:
     """
     Command the drone to return to its launch/home position (RTL mode).
@@ -2404,11 +2694,7 @@ async def return_to_launch(ctx: Context) -> dict:
         dict: Status message with success or error.
     """
     log_tool_call("return_to_launch")
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     logger.info("Initiating Return to Launch (RTL)")
@@ -2433,6 +2719,7 @@ async def return_to_launch(ctx: Context) -> dict:
         return {"status": "failed", "error": f"Return to Launch failed: {str(e)}"}
 
 @mcp.tool()
+@requires_connection
 async def kill_motors(ctx: Context) -> dict:
     """
     EMERGENCY ONLY: Immediately cut power to all motors.
@@ -2447,11 +2734,7 @@ async def kill_motors(ctx: Context) -> dict:
     Returns:
         dict: Status message with success or error.
     """
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     logger.warning(f"{LogColors.YELLOW}⚠️  EMERGENCY MOTOR KILL ACTIVATED ⚠️{LogColors.RESET}")
@@ -2469,6 +2752,7 @@ async def kill_motors(ctx: Context) -> dict:
         return {"status": "failed", "error": f"Motor kill failed: {str(e)}"}
 
 @mcp.tool()
+@requires_connection
 async def hold_position(ctx: Context) -> dict:
     """
     Command the drone to hold its current position using backend-specific station keeping.
@@ -2481,11 +2765,7 @@ async def hold_position(ctx: Context) -> dict:
     Returns:
         dict: Status message with success or error including current position.
     """
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     log_tool_call("hold_position")
     logger.info(f"Commanding drone to hold position via backend={connector.autopilot_backend}")
@@ -2493,7 +2773,7 @@ async def hold_position(ctx: Context) -> dict:
     try:
         adapter = connector.backend_adapter
         if adapter is None:
-            return {"status": "failed", "error": "Autopilot adapter not initialized."}
+            return dict(_ADAPTER_NOT_INITIALIZED_RESULT)
 
         hold_result = await adapter.hold_position()
         result = {
@@ -2521,6 +2801,7 @@ async def hold_position(ctx: Context) -> dict:
         return {"status": "failed", "error": f"Hold position failed: {str(e)}"}
 
 @mcp.tool()
+@requires_connection
 async def get_battery(ctx: Context) -> dict:
     """
     Get the current battery status including voltage and remaining percentage.
@@ -2534,66 +2815,111 @@ async def get_battery(ctx: Context) -> dict:
         dict: Battery voltage (V), remaining percentage (%), and status.
     """
     log_tool_call("get_battery")
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     logger.info("Fetching battery status")
     
     try:
-        async for battery in drone.telemetry.battery():
-            voltage = battery.voltage_v
-            percent_raw = battery.remaining_percent
-            
-            battery_data = {
-                "voltage_v": round(voltage, 2),
-                "remaining_percent": round(percent_raw * 100, 1),  # Convert to percentage
-            }
-            
-            # Handle case where percentage is unavailable/uncalibrated (0% with good voltage)
-            if percent_raw == 0.0 and voltage > 10.0:
-                battery_data["note"] = "⚠️  Battery percentage unavailable - using voltage estimate"
-                battery_data["calibration_status"] = "Uncalibrated or not supported by autopilot"
-                
-                # Rough LiPo estimate: 4.2V = 100%, 3.7V = 50%, 3.5V = 0% per cell
-                # Assume 4S LiPo (most common for drones): 16.8V full, 14.8V nominal, 14.0V empty
-                if voltage >= 16.0:
-                    estimated_percent = 90
-                elif voltage >= 15.2:
-                    estimated_percent = 75
-                elif voltage >= 14.8:
-                    estimated_percent = 50
-                elif voltage >= 14.0:
-                    estimated_percent = 25
-                else:
-                    estimated_percent = 10
-                
-                battery_data["estimated_percent"] = estimated_percent
-                battery_data["hint"] = "Set battery capacity parameter (BATT_CAPACITY) for accurate readings"
-            
-            # Add warning if battery is low (use estimated if percentage unavailable)
-            effective_percent = percent_raw if percent_raw > 0 else (battery_data.get("estimated_percent", 100) / 100)
+        battery = await _read_telemetry(connector, "battery", drone.telemetry.battery)
+        voltage = battery.voltage_v
+        percent_raw = battery.remaining_percent
+        
+        battery_data = {
+            "voltage_v": round(voltage, 2),
+            "remaining_percent": round(percent_raw * 100, 1),  # Convert to percentage
+        }
+        
+        # Handle case where percentage is unavailable/uncalibrated (0% with good voltage)
+        if percent_raw == 0.0 and voltage > 10.0:
+            battery_data["note"] = "⚠️  Battery percentage unavailable - using voltage estimate"
+            battery_data["calibration_status"] = "Uncalibrated or not supported by autopilot"
             
-            if effective_percent < 0.20:
-                battery_data["warning"] = "⚠️  LOW BATTERY - Land soon!"
-            elif effective_percent < 0.30:
-                battery_data["warning"] = "Battery getting low - consider landing"
+            # Rough LiPo estimate: 4.2V = 100%, 3.7V = 50%, 3.5V = 0% per cell
+            # Assume 4S LiPo (most common for drones): 16.8V full, 14.8V nominal, 14.0V empty
+            if voltage >= 16.0:
+                estimated_percent = 90
+            elif voltage >= 15.2:
+                estimated_percent = 75
+            elif voltage >= 14.8:
+                estimated_percent = 50
+            elif voltage >= 14.0:
+                estimated_percent = 25
+            else:
+                estimated_percent = 10
             
-            logger.info(f"{LogColors.STATUS}Battery: {battery_data['voltage_v']}V, {battery_data['remaining_percent']}% "
-                       f"{'(estimated: ' + str(battery_data.get('estimated_percent', '')) + '%)' if 'estimated_percent' in battery_data else ''}{LogColors.RESET}")
-            return {"status": "success", "battery": battery_data}
+            battery_data["estimated_percent"] = estimated_percent
+            battery_data["hint"] = "Set battery capacity parameter (BATT_CAPACITY) for accurate readings"
+        
+        # Add warning if battery is low (use estimated if percentage unavailable)
+        effective_percent = percent_raw if percent_raw > 0 else (battery_data.get("estimated_percent", 100) / 100)
+        
+        if effective_percent < 0.20:
+            battery_data["warning"] = "⚠️  LOW BATTERY - Land soon!"
+        elif effective_percent < 0.30:
+            battery_data["warning"] = "Battery getting low - consider landing"
+        
+        if "estimated_percent" in battery_data:
+            logger.info(
+                "%sBattery: %sV, %s%% (estimated: %s%%)%s", LogColors.STATUS,
+                battery_data["voltage_v"], battery_data["remaining_percent"],
+                battery_data["estimated_percent"], LogColors.RESET,
+            )
+        else:
+            logger.info(
+                "%sBattery: %sV, %s%% %s", LogColors.STATUS,
+                battery_data["voltage_v"], battery_data["remaining_percent"], LogColors.RESET,
+            )
+        return {"status": "success", "battery": battery_data}
     except Exception as e:
-        logger.error(f"{LogColors.ERROR}❌ TOOL ERROR - Failed to get battery status: {e}{LogColors.RESET}")
+        logger.error("%s❌ TOOL ERROR - Failed to get battery status: %s%s", LogColors.ERROR, e, LogColors.RESET)
         return {"status": "failed", "error": f"Battery read failed: {str(e)}"}
 
 # ============================================================================
 # PRIORITY 2: FLIGHT MODE MANAGEMENT & SYSTEM HEALTH (v1.1.0)
 # ============================================================================
 
+# (Health attribute, warning reported when it is False), in report order
+_HEALTH_WARNINGS = (
+    ("is_global_position_ok", "⚠️  No GPS lock - cannot fly safely!"),
+    ("is_armable", "⚠️  Drone is not armable - check for errors"),
+    ("is_gyrometer_calibration_ok", "Gyroscope needs calibration"),
+    ("is_accelerometer_calibration_ok", "Accelerometer needs calibration"),
+    ("is_magnetometer_calibration_ok", "Magnetometer/compass needs calibration"),
+)
+
+
+# Output key -> MAVSDK Health attribute, in get_health's response order
+_HEALTH_FIELDS = (
+    ("is_gyrometer_calibrated", "is_gyrometer_calibration_ok"),
+    ("is_accelerometer_calibrated", "is_accelerometer_calibration_ok"),
+    ("is_magnetometer_calibrated", "is_magnetometer_calibration_ok"),
+    ("is_local_position_ok", "is_local_position_ok"),
+    ("is_global_position_ok", "is_global_position_ok"),
+    ("is_home_position_ok", "is_home_position_ok"),
+    ("is_armable", "is_armable"),
+)
+_HEALTH_KEYS = tuple(key for key, _ in _HEALTH_FIELDS)
+_health_values = operator.attrgetter(*(attr for _, attr in _HEALTH_FIELDS))
+
+
+def _build_health_data(health) -> dict:
+    """Summarize a MAVSDK Health message for get_health and get_status."""
+    health_data = dict(zip(_HEALTH_KEYS, _health_values(health)))
+
+    # Add overall health assessment
+    all_ok = all(health_data.values())
+    health_data["overall_status"] = "HEALTHY" if all_ok else "ISSUES DETECTED"
+
+    # Add warnings for critical issues
+    warnings = [message for attr, message in _HEALTH_WARNINGS if not getattr(health, attr)]
+    if warnings:
+        health_data["warnings"] = warnings
+    return health_data
+
+
 @mcp.tool()
+@requires_connection
 async def get_health(ctx: Context) -> dict:
     """
     Get comprehensive system health status for pre-flight checks.
@@ -2607,57 +2933,25 @@ async def get_health(ctx: Context) -> dict:
         dict: Comprehensive health status of all drone subsystems.
     """
     log_tool_call("get_health")
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     logger.info("Fetching system health")
     
     try:
-        async for health in drone.telemetry.health():
-            health_data = {
-                "is_gyrometer_calibrated": health.is_gyrometer_calibration_ok,
-                "is_accelerometer_calibrated": health.is_accelerometer_calibration_ok,
-                "is_magnetometer_calibrated": health.is_magnetometer_calibration_ok,
-                "is_local_position_ok": health.is_local_position_ok,
-                "is_global_position_ok": health.is_global_position_ok,
-                "is_home_position_ok": health.is_home_position_ok,
-                "is_armable": health.is_armable,
-            }
-            
-            # Add overall health assessment
-            all_ok = all(health_data.values())
-            health_data["overall_status"] = "HEALTHY" if all_ok else "ISSUES DETECTED"
-            
-            # Add warnings for critical issues
-            warnings = []
-            if not health.is_global_position_ok:
-                warnings.append("⚠️  No GPS lock - cannot fly safely!")
-            if not health.is_armable:
-                warnings.append("⚠️  Drone is not armable - check for errors")
-            if not health.is_gyrometer_calibration_ok:
-                warnings.append("Gyroscope needs calibration")
-            if not health.is_accelerometer_calibration_ok:
-                warnings.append("Accelerometer needs calibration")
-            if not health.is_magnetometer_calibration_ok:
-                warnings.append("Magnetometer/compass needs calibration")
-            
-            if warnings:
-                health_data["warnings"] = warnings
-            
-            logger.info(f"{LogColors.STATUS}System health: {health_data['overall_status']}{LogColors.RESET}")
-            result = {
-                "status": "success",
-                "health": health_data,
-                "backend": await connector.backend_adapter.get_backend_info() if connector.backend_adapter else None,
-            }
-            log_tool_output(result)
-            return result
+        health, age_s = await _read_telemetry_aged(connector, "health", drone.telemetry.health)
+        health_data = _build_health_data(health)
+        logger.info("%sSystem health: %s%s", LogColors.STATUS, health_data["overall_status"], LogColors.RESET)
+        result = {
+            "status": "success",
+            "health": health_data,
+            "age_s": round(age_s, 2),
+            "backend": await connector.backend_adapter.get_backend_info() if connector.backend_adapter else None,
+        }
+        log_tool_output(result)
+        return result
     except Exception as e:
-        logger.error(f"{LogColors.ERROR}❌ TOOL ERROR - Failed to get health status: {e}{LogColors.RESET}")
+        logger.error("%s❌ TOOL ERROR - Failed to get health status: %s%s", LogColors.ERROR, e, LogColors.RESET)
         return {"status": "failed", "error": f"Health check failed: {str(e)}"}
 
 @mcp.tool()
@@ -2703,6 +2997,7 @@ async def pause_mission(ctx: Context) -> dict:
     }
 
 @mcp.tool()
+@requires_connection
 async def hold_mission_position(ctx: Context) -> dict:
     """
     Alternative to pause_mission that holds position in GUIDED mode instead of LOITER.
@@ -2726,36 +3021,37 @@ async def hold_mission_position(ctx: Context) -> dict:
     Returns:
         dict: Status message with current position and waypoint info.
     """
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     log_tool_call("hold_mission_position")
     
     try:
-        # Get current mission progress before holding
+        # Read mission progress and current position concurrently before holding
         current_wp = 0
         total_wp = 0
-        async for mission_progress in drone.mission.mission_progress():
+        mission_progress, position = await asyncio.gather(
+            _read_one(drone.mission.mission_progress()),
+            _first_value(drone.telemetry.position()),
+            return_exceptions=True,
+        )
+        # Both reads are required; let the sibling finish before surfacing a failure
+        for outcome in (mission_progress, position):
+            if isinstance(outcome, BaseException):
+                raise outcome
+        if mission_progress:
             current_wp = mission_progress.current
             total_wp = mission_progress.total
-            break
         
-        # Get current position
-        async for position in drone.telemetry.position():
-            current_lat = position.latitude_deg
-            current_lon = position.longitude_deg
-            current_alt = position.absolute_altitude_m
-            break
+        current_lat = position.latitude_deg
+        current_lon = position.longitude_deg
+        current_alt = position.absolute_altitude_m
         
         # Use hold_position to stay in GUIDED mode
         # This will call goto_location with current position
         log_mavlink_cmd(f"drone.action.goto_location(lat={current_lat}, lon={current_lon}, alt={current_alt})")
         logger.info(f"⚠️  Holding mission position in GUIDED mode (not LOITER) - was at waypoint {current_wp}/{total_wp}")
-        await drone.action.goto_location(current_lat, current_lon, current_alt, float('nan'))
+        await drone.action.goto_location(current_lat, current_lon, current_alt, _NAN)
 
         begin_activity(
             connector,
@@ -2788,6 +3084,7 @@ async def hold_mission_position(ctx: Context) -> dict:
         return {"status": "failed", "error": f"Hold mission position failed: {str(e)}"}
 
 @mcp.tool()
+@requires_connection
 async def resume_mission(ctx: Context) -> dict:
     """
     Resume a previously paused mission.
@@ -2800,11 +3097,7 @@ async def resume_mission(ctx: Context) -> dict:
     Returns:
         dict: Status message with success or error including current waypoint.
     """
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     log_tool_call("resume_mission")
@@ -2813,10 +3106,10 @@ async def resume_mission(ctx: Context) -> dict:
         # Get current mission progress before resuming
         current_wp = 0
         total_wp = 0
-        async for mission_progress in drone.mission.mission_progress():
+        mission_progress = await _read_one(drone.mission.mission_progress())
+        if mission_progress:
             current_wp = mission_progress.current
             total_wp = mission_progress.total
-            break
 
         execution = MissionExecutionRecord(
             id=_runtime_id("missionexec"),
@@ -2857,6 +3150,7 @@ async def resume_mission(ctx: Context) -> dict:
         return {"status": "failed", "error": f"Mission resume failed: {str(e)}"}
 
 @mcp.tool()
+@requires_connection
 async def clear_mission(ctx: Context) -> dict:
     """
     Clear the current mission from the drone.
@@ -2869,11 +3163,7 @@ async def clear_mission(ctx: Context) -> dict:
     Returns:
         dict: Status message with success or error.
     """
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     logger.info("Clearing mission")
@@ -2903,6 +3193,7 @@ async def clear_mission(ctx: Context) -> dict:
 # ============================================================================
 
 @mcp.tool()
+@requires_connection
 async def go_to_location(ctx: Context, latitude_deg: float, longitude_deg: float, 
                         absolute_altitude_m: float, yaw_deg: float = float('nan')) -> dict:
     """
@@ -2928,46 +3219,46 @@ async def go_to_location(ctx: Context, latitude_deg: float, longitude_deg: float
     """
     log_tool_call("go_to_location", latitude_deg=latitude_deg, longitude_deg=longitude_deg, 
                   absolute_altitude_m=absolute_altitude_m)
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     # Validate coordinates
-    if not (-90 <= latitude_deg <= 90):
-        return {"status": "failed", "error": f"Invalid latitude: {latitude_deg}. Must be between -90 and 90."}
-    if not (-180 <= longitude_deg <= 180):
-        return {"status": "failed", "error": f"Invalid longitude: {longitude_deg}. Must be between -180 and 180."}
+    coordinate_error = _validate_coordinates(latitude_deg, longitude_deg)
+    if coordinate_error:
+        return coordinate_error
     
     drone = connector.drone
     
     try:
-        # Get current position to calculate relative altitude and initial distance
-        position = await drone.telemetry.position().__anext__()
+        # Read current position (relative altitude, initial distance) and speed
+        # (flight time estimate) concurrently
+        position, velocity = await asyncio.gather(
+            _first_value(drone.telemetry.position()),
+            _first_value(drone.telemetry.velocity_ned()),
+            return_exceptions=True,
+        )
+        if isinstance(position, BaseException):
+            raise position
         home_alt = position.absolute_altitude_m - position.relative_altitude_m
         relative_alt = absolute_altitude_m - home_alt
         initial_distance = haversine_distance(position.latitude_deg, position.longitude_deg, 
                                                latitude_deg, longitude_deg)
         
-        # Get current speed to estimate flight time
-        try:
-            async for velocity in drone.telemetry.velocity_ned():
-                ground_speed = math.sqrt(velocity.north_m_s**2 + velocity.east_m_s**2)
-                break
-        except:
+        # Current speed for the flight time estimate
+        if isinstance(velocity, BaseException):
             ground_speed = 10.0  # Default assumption
+        else:
+            ground_speed = math.hypot(velocity.north_m_s, velocity.east_m_s)
         
         # Estimate flight time (assuming ~10-15 m/s cruise speed for copter)
         estimated_speed = max(ground_speed, 10.0)  # At least 10 m/s for ETA
         eta_seconds = initial_distance / estimated_speed
         
-        logger.info(f"Flying to GPS location: {latitude_deg}, {longitude_deg} at {relative_alt:.1f}m AGL / {absolute_altitude_m:.1f}m MSL")
-        logger.info(f"Distance to target: {initial_distance:.1f}m, ETA: {eta_seconds:.0f}s")
+        logger.info("Flying to GPS location: %s, %s at %.1fm AGL / %.1fm MSL", latitude_deg, longitude_deg, relative_alt, absolute_altitude_m)
+        logger.info("Distance to target: %.1fm, ETA: %.0fs", initial_distance, eta_seconds)
 
         adapter = connector.backend_adapter
         if adapter is None:
-            return {"status": "failed", "error": "Autopilot adapter not initialized."}
+            return dict(_ADAPTER_NOT_INITIALIZED_RESULT)
         await adapter.go_to_location(latitude_deg, longitude_deg, absolute_altitude_m, yaw_deg)
         
         # Create FlightActivity for unified tracking
@@ -3013,10 +3304,11 @@ async def go_to_location(ctx: Context, latitude_deg: float, longitude_deg: float
         return result
         
     except Exception as e:
-        logger.error(f"Go to location failed: {e}{LogColors.RESET}")
+        logger.error("Go to location failed: %s%s", e, LogColors.RESET)
         return {"status": "failed", "error": f"Navigation failed: {str(e)}"}
 
 @mcp.tool()
+@requires_connection
 async def check_arrival(
     ctx: Context,
     latitude_deg: float,
@@ -3043,17 +3335,12 @@ async def check_arrival(
     """
     log_tool_call("check_arrival", latitude_deg=latitude_deg, longitude_deg=longitude_deg, 
                   threshold_m=threshold_m)
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     # Validate coordinates
-    if not (-90 <= latitude_deg <= 90):
-        return {"status": "failed", "error": f"Invalid latitude: {latitude_deg}. Must be between -90 and 90."}
-    if not (-180 <= longitude_deg <= 180):
-        return {"status": "failed", "error": f"Invalid longitude: {longitude_deg}. Must be between -180 and 180."}
+    coordinate_error = _validate_coordinates(latitude_deg, longitude_deg)
+    if coordinate_error:
+        return coordinate_error
     
     drone = connector.drone
     
@@ -3109,6 +3396,7 @@ async def check_arrival(
 
 
 @mcp.tool()
+@requires_connection
 async def monitor_flight(ctx: Context, arrival_threshold_m: float = 20.0, auto_land: bool = True) -> dict:
     """
     Monitor flight progress. YOU MUST CALL THIS IN A LOOP UNTIL mission_complete IS TRUE.
@@ -3137,18 +3425,14 @@ async def monitor_flight(ctx: Context, arrival_threshold_m: float = 20.0, auto_l
     wait_seconds = 30.0
     
     log_tool_call("monitor_flight", arrival_threshold_m=arrival_threshold_m, auto_land=auto_land)
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     
     try:
         # First, check if drone is on the ground (mission complete)
         async for landed_state in drone.telemetry.landed_state():
-            landed_state_str = str(landed_state).split(".")[-1]
+            landed_state_str = _enum_name(landed_state)
             break
         
         async for in_air in drone.telemetry.in_air():
@@ -3259,7 +3543,7 @@ async def monitor_flight(ctx: Context, arrival_threshold_m: float = 20.0, auto_l
             # Get speed for ETA calculation
             try:
                 async for velocity in drone.telemetry.velocity_ned():
-                    ground_speed = math.sqrt(velocity.north_m_s**2 + velocity.east_m_s**2)
+                    ground_speed = math.hypot(velocity.north_m_s, velocity.east_m_s)
                     break
             except:
                 ground_speed = 0
@@ -3315,7 +3599,7 @@ async def monitor_flight(ctx: Context, arrival_threshold_m: float = 20.0, auto_l
                             is_in_air = in_air
                             break
                         
-                        landed_state_str = str(landed_state).split(".")[-1]
+                        landed_state_str = _enum_name(landed_state)
                         
                         # Only consider landed when PX4 reports ON_GROUND AND not in air AND altitude < 2m
                         if landed_state_str == "ON_GROUND" and not is_in_air and current_alt < 2.0:
@@ -3331,7 +3615,7 @@ async def monitor_flight(ctx: Context, arrival_threshold_m: float = 20.0, auto_l
                                 is_in_air = in_air
                                 break
                             
-                            landed_state_str = str(landed_state).split(".")[-1]
+                            landed_state_str = _enum_name(landed_state)
                             if landed_state_str == "ON_GROUND" and not is_in_air:
                                 # Confirmed landed! Mark activity completed
                                 if connector.current_activity:
@@ -3412,6 +3696,7 @@ async def monitor_flight(ctx: Context, arrival_threshold_m: float = 20.0, auto_l
 
 
 @mcp.tool()
+@requires_connection
 async def get_home_position(ctx: Context) -> dict:
     """
     Get the home position where Return to Launch (RTL) will return to.
@@ -3424,29 +3709,26 @@ async def get_home_position(ctx: Context) -> dict:
     Returns:
         dict: Home position coordinates and altitude.
     """
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     logger.info("Fetching home position")
     
     try:
-        async for home in drone.telemetry.home():
-            home_data = {
-                "latitude_deg": home.latitude_deg,
-                "longitude_deg": home.longitude_deg,
-                "absolute_altitude_m": home.absolute_altitude_m,
-            }
-            logger.info(f"Home position: {home_data['latitude_deg']}, {home_data['longitude_deg']} at {home_data['absolute_altitude_m']}m")
-            return {"status": "success", "home": home_data}
+        home = await _single_flight(connector, "home", lambda: _first_value(drone.telemetry.home()))
+        home_data = {
+            "latitude_deg": home.latitude_deg,
+            "longitude_deg": home.longitude_deg,
+            "absolute_altitude_m": home.absolute_altitude_m,
+        }
+        logger.info("Home position: %s, %s at %sm", home_data["latitude_deg"], home_data["longitude_deg"], home_data["absolute_altitude_m"])
+        return {"status": "success", "home": home_data}
     except Exception as e:
-        logger.error(f"{LogColors.ERROR}❌ TOOL ERROR - Failed to get home position: {e}{LogColors.RESET}")
+        logger.error("%s❌ TOOL ERROR - Failed to get home position: %s%s", LogColors.ERROR, e, LogColors.RESET)
         return {"status": "failed", "error": f"Home position read failed: {str(e)}"}
 
 @mcp.tool()
+@requires_connection
 async def set_max_speed(ctx: Context, speed_m_s: float) -> dict:
     """
     Set the maximum speed limit for the drone.
@@ -3460,11 +3742,7 @@ async def set_max_speed(ctx: Context, speed_m_s: float) -> dict:
     Returns:
         dict: Status message with success or error.
     """
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     # Validate speed
     if speed_m_s <= 0:
@@ -3473,7 +3751,7 @@ async def set_max_speed(ctx: Context, speed_m_s: float) -> dict:
         return {"status": "failed", "error": f"Speed too high: {speed_m_s} m/s. Maximum is 30 m/s for safety."}
     
     drone = connector.drone
-    logger.info(f"Setting maximum speed to {speed_m_s} m/s")
+    logger.info("Setting maximum speed to %s m/s", speed_m_s)
     
     try:
         log_mavlink_cmd("drone.action.set_maximum_speed", speed_m_s=speed_m_s)
@@ -3484,7 +3762,7 @@ async def set_max_speed(ctx: Context, speed_m_s: float) -> dict:
             "speed_kmh": round(speed_m_s * 3.6, 1)  # Also provide in km/h
         }
     except Exception as e:
-        logger.error(f"{LogColors.ERROR}❌ TOOL ERROR - Failed to set max speed: {e}{LogColors.RESET}")
+        logger.error("%s❌ TOOL ERROR - Failed to set max speed: %s%s", LogColors.ERROR, e, LogColors.RESET)
         return {"status": "failed", "error": f"Set max speed failed: {str(e)}"}
 
 # ============================================================================
@@ -3492,6 +3770,7 @@ async def set_max_speed(ctx: Context, speed_m_s: float) -> dict:
 # ============================================================================
 
 @mcp.tool()
+@requires_connection
 async def get_speed(ctx: Context) -> dict:
     """
     Get the current ground speed (velocity over ground).
@@ -3504,35 +3783,32 @@ async def get_speed(ctx: Context) -> dict:
     Returns:
         dict: Current velocity in NED frame and total ground speed.
     """
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     logger.info("Fetching ground speed")
     
     try:
-        async for velocity in drone.telemetry.velocity_ned():
-            # Calculate total ground speed (horizontal speed only)
-            ground_speed_m_s = math.sqrt(velocity.north_m_s**2 + velocity.east_m_s**2)
-            
-            speed_data = {
-                "north_m_s": velocity.north_m_s,
-                "east_m_s": velocity.east_m_s,
-                "down_m_s": velocity.down_m_s,
-                "ground_speed_m_s": round(ground_speed_m_s, 2),
-                "ground_speed_kmh": round(ground_speed_m_s * 3.6, 2),
-            }
-            
-            logger.info(f"Ground speed: {speed_data['ground_speed_m_s']} m/s ({speed_data['ground_speed_kmh']} km/h)")
-            return {"status": "success", "velocity": speed_data}
+        velocity, age_s = await _read_telemetry_aged(connector, "velocity_ned", drone.telemetry.velocity_ned)
+        # Calculate total ground speed (horizontal speed only)
+        ground_speed_m_s = math.hypot(velocity.north_m_s, velocity.east_m_s)
+        
+        speed_data = {
+            "north_m_s": velocity.north_m_s,
+            "east_m_s": velocity.east_m_s,
+            "down_m_s": velocity.down_m_s,
+            "ground_speed_m_s": round(ground_speed_m_s, 2),
+            "ground_speed_kmh": round(ground_speed_m_s * 3.6, 2),
+        }
+        
+        logger.info("Ground speed: %s m/s (%s km/h)", speed_data["ground_speed_m_s"], speed_data["ground_speed_kmh"])
+        return {"status": "success", "velocity": speed_data, "age_s": round(age_s, 2)}
     except Exception as e:
-        logger.error(f"{LogColors.ERROR}❌ TOOL ERROR - Failed to get speed: {e}{LogColors.RESET}")
+        logger.error("%s❌ TOOL ERROR - Failed to get speed: %s%s", LogColors.ERROR, e, LogColors.RESET)
         return {"status": "failed", "error": f"Speed read failed: {str(e)}"}
 
 @mcp.tool()
+@requires_connection
 async def get_attitude(ctx: Context) -> dict:
     """
     Get the current attitude (orientation) of the drone.
@@ -3545,30 +3821,36 @@ async def get_attitude(ctx: Context) -> dict:
     Returns:
         dict: Roll, pitch, yaw angles in degrees.
     """
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     logger.info("Fetching attitude")
     
     try:
-        async for attitude in drone.telemetry.attitude_euler():
-            attitude_data = {
-                "roll_deg": round(attitude.roll_deg, 2),
-                "pitch_deg": round(attitude.pitch_deg, 2),
-                "yaw_deg": round(attitude.yaw_deg, 2),
-            }
-            
-            logger.info(f"Attitude: roll={attitude_data['roll_deg']}°, pitch={attitude_data['pitch_deg']}°, yaw={attitude_data['yaw_deg']}°")
-            return {"status": "success", "attitude": attitude_data}
+        attitude = await _single_flight(connector, "attitude_euler", lambda: _first_value(drone.telemetry.attitude_euler()))
+        attitude_data = {
+            "roll_deg": round(attitude.roll_deg, 2),
+            "pitch_deg": round(attitude.pitch_deg, 2),
+            "yaw_deg": round(attitude.yaw_deg, 2),
+        }
+        
+        logger.info("Attitude: roll=%s°, pitch=%s°, yaw=%s°", attitude_data["roll_deg"], attitude_data["pitch_deg"], attitude_data["yaw_deg"])
+        return {"status": "success", "attitude": attitude_data}
     except Exception as e:
-        logger.error(f"{LogColors.ERROR}❌ TOOL ERROR - Failed to get attitude: {e}{LogColors.RESET}")
+        logger.error("%s❌ TOOL ERROR - Failed to get attitude: %s%s", LogColors.ERROR, e, LogColors.RESET)
         return {"status": "failed", "error": f"Attitude read failed: {str(e)}"}
 
+# Satellite counts at which GPS quality steps up, and (quality, warning) per band
+_GPS_SATELLITE_THRESHOLDS = (4, 6, 10)
+_GPS_QUALITY = (
+    ("Poor", "⚠️  Insufficient satellites for reliable navigation!"),
+    ("Marginal", None),
+    ("Good", None),
+    ("Excellent", None),
+)
+
 @mcp.tool()
+@requires_connection
 async def get_gps_info(ctx: Context) -> dict:
     """
     Get detailed GPS information including number of satellites and fix type.
@@ -3581,40 +3863,32 @@ async def get_gps_info(ctx: Context) -> dict:
     Returns:
         dict: GPS satellite count, fix type, and quality metrics.
     """
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     logger.info("Fetching GPS info")
     
     try:
-        async for gps_info in drone.telemetry.gps_info():
-            gps_data = {
-                "num_satellites": gps_info.num_satellites,
-                "fix_type": str(gps_info.fix_type),
-            }
-            
-            # Add quality assessment
-            if gps_info.num_satellites >= 10:
-                gps_data["quality"] = "Excellent"
-            elif gps_info.num_satellites >= 6:
-                gps_data["quality"] = "Good"
-            elif gps_info.num_satellites >= 4:
-                gps_data["quality"] = "Marginal"
-            else:
-                gps_data["quality"] = "Poor"
-                gps_data["warning"] = "⚠️  Insufficient satellites for reliable navigation!"
-            
-            logger.info(f"GPS: {gps_data['num_satellites']} satellites, {gps_data['fix_type']}, {gps_data['quality']}")
-            return {"status": "success", "gps": gps_data}
+        gps_info = await _single_flight(connector, "gps_info", lambda: _first_value(drone.telemetry.gps_info()))
+        gps_data = {
+            "num_satellites": gps_info.num_satellites,
+            "fix_type": str(gps_info.fix_type),
+        }
+        
+        # Add quality assessment
+        quality, warning = _GPS_QUALITY[bisect.bisect_right(_GPS_SATELLITE_THRESHOLDS, gps_info.num_satellites)]
+        gps_data["quality"] = quality
+        if warning:
+            gps_data["warning"] = warning
+        
+        logger.info("GPS: %s satellites, %s, %s", gps_data["num_satellites"], gps_data["fix_type"], gps_data["quality"])
+        return {"status": "success", "gps": gps_data}
     except Exception as e:
-        logger.error(f"{LogColors.ERROR}❌ TOOL ERROR - Failed to get GPS info: {e}{LogColors.RESET}")
+        logger.error("%s❌ TOOL ERROR - Failed to get GPS info: %s%s", LogColors.ERROR, e, LogColors.RESET)
         return {"status": "failed", "error": f"GPS info read failed: {str(e)}"}
 
 @mcp.tool()
+@requires_connection
 async def get_in_air(ctx: Context) -> dict:
     """
     Check if the drone is currently in the air (flying) or on the ground.
@@ -3626,29 +3900,27 @@ async def get_in_air(ctx: Context) -> dict:
     Returns:
         dict: Boolean indicating if drone is airborne.
     """
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     logger.info("Checking if drone is in air")
     
     try:
-        async for in_air in drone.telemetry.in_air():
-            status_text = "IN AIR (flying)" if in_air else "ON GROUND"
-            logger.info(f"{LogColors.STATUS}Drone status: {status_text}{LogColors.RESET}")
-            return {
-                "status": "success", 
-                "in_air": in_air,
-                "status_text": status_text
-            }
+        in_air, age_s = await _read_telemetry_aged(connector, "in_air", drone.telemetry.in_air)
+        status_text = "IN AIR (flying)" if in_air else "ON GROUND"
+        logger.info("%sDrone status: %s%s", LogColors.STATUS, status_text, LogColors.RESET)
+        return {
+            "status": "success", 
+            "in_air": in_air,
+            "status_text": status_text,
+            "age_s": round(age_s, 2)
+        }
     except Exception as e:
-        logger.error(f"{LogColors.ERROR}❌ TOOL ERROR - Failed to check in_air status: {e}{LogColors.RESET}")
+        logger.error("%s❌ TOOL ERROR - Failed to check in_air status: %s%s", LogColors.ERROR, e, LogColors.RESET)
         return {"status": "failed", "error": f"In-air check failed: {str(e)}"}
 
 @mcp.tool()
+@requires_connection
 async def get_armed(ctx: Context) -> dict:
     """
     Check if the drone is currently armed (motors can spin).
@@ -3660,33 +3932,99 @@ async def get_armed(ctx: Context) -> dict:
     Returns:
         dict: Boolean indicating if drone is armed.
     """
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
+    
+    drone = connector.drone
+    logger.info("Checking if drone is armed")
+    
+    try:
+        armed, age_s = await _read_telemetry_aged(connector, "armed", drone.telemetry.armed)
+        status_text = "ARMED (motors ready)" if armed else "DISARMED (motors off)"
+        logger.info("%sDrone status: %s%s", LogColors.STATUS, status_text, LogColors.RESET)
+        return {
+            "status": "success", 
+            "armed": armed,
+            "status_text": status_text,
+            "age_s": round(age_s, 2)
+        }
+    except Exception as e:
+        logger.error("%s❌ TOOL ERROR - Failed to check armed status: %s%s", LogColors.ERROR, e, LogColors.RESET)
+        return {"status": "failed", "error": f"Armed check failed: {str(e)}"}
+
+@mcp.tool()
+@requires_connection
+async def get_status(ctx: Context) -> dict:
+    """
+    Get armed state, in-air state and system health in one call.
+    Use this for pre-flight checklists instead of calling get_armed,
+    get_in_air and get_health separately. Waits for connection if not ready.
+
+    Args:
+        ctx (Context): The context of the request.
+
+    Returns:
+        dict: Armed and in-air flags plus the same health summary as get_health.
+    """
+    log_tool_call("get_status")
+    connector = _get_connector(ctx)
     
     drone = connector.drone
-    logger.info("Checking if drone is armed")
+    logger.info("Fetching armed, in-air and health status")
     
     try:
-        async for armed in drone.telemetry.armed():
-            status_text = "ARMED (motors ready)" if armed else "DISARMED (motors off)"
-            logger.info(f"{LogColors.STATUS}Drone status: {status_text}{LogColors.RESET}")
-            return {
-                "status": "success", 
-                "armed": armed,
-                "status_text": status_text
-            }
+        outcomes = await asyncio.gather(
+            _read_telemetry_aged(connector, "armed", drone.telemetry.armed),
+            _read_telemetry_aged(connector, "in_air", drone.telemetry.in_air),
+            _read_telemetry_aged(connector, "health", drone.telemetry.health),
+            return_exceptions=True,
+        )
+        # Report each failed read instead of dropping the ones that succeeded
+        values = {}
+        errors = {}
+        age_s = 0.0
+        for key, outcome in zip(("armed", "in_air", "health"), outcomes):
+            if isinstance(outcome, BaseException):
+                errors[key] = str(outcome) or type(outcome).__name__
+                values[key] = None
+            else:
+                values[key], key_age_s = outcome
+                age_s = max(age_s, key_age_s)
+
+        health_data = _build_health_data(values["health"]) if values["health"] is not None else None
+        result = {
+            "status": "success",
+            "armed": values["armed"],
+            "in_air": values["in_air"],
+            "health": health_data,
+            "age_s": round(age_s, 2),
+        }
+        if errors:
+            # Same failed shape as get_armed/get_in_air/get_health, plus whatever was read
+            detail = "; ".join(f"{key}: {message}" for key, message in errors.items())
+            logger.error("%s❌ TOOL ERROR - Failed to get status: %s%s", LogColors.ERROR, detail, LogColors.RESET)
+            result["status"] = "failed"
+            result["error"] = f"Status read failed: {detail}"
+            result["errors"] = errors
+        else:
+            logger.info(
+                "%sStatus: armed=%s, in_air=%s, health=%s%s", LogColors.STATUS,
+                values["armed"], values["in_air"], health_data["overall_status"], LogColors.RESET,
+            )
+        log_tool_output(result)
+        return result
     except Exception as e:
-        logger.error(f"{LogColors.ERROR}❌ TOOL ERROR - Failed to check armed status: {e}{LogColors.RESET}")
-        return {"status": "failed", "error": f"Armed check failed: {str(e)}"}
+        logger.error("%s❌ TOOL ERROR - Failed to get status: %s%s", LogColors.ERROR, e, LogColors.RESET)
+        return {"status": "failed", "error": f"Status read failed: {str(e)}"}
 
 # ============================================================================
 # v1.2.0: PARAMETER MANAGEMENT
 # ============================================================================
 
+# How long list_parameters reuses a full parameter download
+PARAM_CACHE_TTL_S = 60.0
+
 @mcp.tool()
+@requires_connection
 async def get_parameter(ctx: Context, name: str, param_type: str = "auto") -> dict:
     """
     Get the value of a drone parameter by name.
@@ -3707,18 +4045,15 @@ async def get_parameter(ctx: Context, name: str, param_type: str = "auto") -> di
         - get_parameter("BATT_CAPACITY", "int") - Get battery capacity in mAh
         - get_parameter("WPNAV_SPEED") - Auto-detect parameter type
     """
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
-    logger.info(f"Getting parameter: {name} (type: {param_type})")
+    logger.info("Getting parameter: %s (type: %s)", name, param_type)
     
     try:
         if param_type == "int":
             value = await drone.param.get_param_int(name)
+            connector._param_types[name] = "int"
             return {
                 "status": "success",
                 "name": name,
@@ -3727,6 +4062,7 @@ async def get_parameter(ctx: Context, name: str, param_type: str = "auto") -> di
             }
         elif param_type == "float":
             value = await drone.param.get_param_float(name)
+            connector._param_types[name] = "float"
             return {
                 "status": "success",
                 "name": name,
@@ -3734,26 +4070,30 @@ async def get_parameter(ctx: Context, name: str, param_type: str = "auto") -> di
                 "type": "float"
             }
         else:  # auto-detect
-            # Try float first (most common)
-            try:
-                value = await drone.param.get_param_float(name)
-                return {
-                    "status": "success",
-                    "name": name,
-                    "value": value,
-                    "type": "float"
-                }
-            except:
-                # If float fails, try int
-                value = await drone.param.get_param_int(name)
-                return {
-                    "status": "success",
-                    "name": name,
-                    "value": value,
-                    "type": "int"
-                }
+            # A known int skips the float probe; otherwise try float first (most common)
+            if connector._param_types.get(name) != "int":
+                try:
+                    value = await drone.param.get_param_float(name)
+                    connector._param_types[name] = "float"
+                    return {
+                        "status": "success",
+                        "name": name,
+                        "value": value,
+                        "type": "float"
+                    }
+                except ParamError:
+                    pass
+            # If float fails (or the name is a known int), read it as int
+            value = await drone.param.get_param_int(name)
+            connector._param_types[name] = "int"
+            return {
+                "status": "success",
+                "name": name,
+                "value": value,
+                "type": "int"
+            }
     except Exception as e:
-        logger.error(f"{LogColors.ERROR}❌ TOOL ERROR - Failed to get parameter {name}: {e}{LogColors.RESET}")
+        logger.error("%s❌ TOOL ERROR - Failed to get parameter %s: %s%s", LogColors.ERROR, name, e, LogColors.RESET)
         return {
             "status": "failed", 
             "error": f"Parameter '{name}' not found or inaccessible: {str(e)}",
@@ -3761,6 +4101,7 @@ async def get_parameter(ctx: Context, name: str, param_type: str = "auto") -> di
         }
 
 @mcp.tool()
+@requires_connection
 async def set_parameter(ctx: Context, name: str, value: float, param_type: str = "auto") -> dict:
     """
     Set the value of a drone parameter by name.
@@ -3787,38 +4128,37 @@ async def set_parameter(ctx: Context, name: str, value: float, param_type: str =
         - Consider backing up parameters before changes
         - Some parameters require reboot to take effect
     """
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
-    logger.warning(f"⚠️ Setting parameter: {name} = {value} (type: {param_type})")
+    logger.warning("⚠️ Setting parameter: %s = %s (type: %s)", name, value, param_type)
     
     try:
-        # Get old value first
+        # Get old value first (a name known to be float skips the int probe)
         try:
-            if param_type == "int" or (param_type == "auto" and value == int(value)):
+            known_float = connector._param_types.get(name) == "float"
+            if param_type == "int" or (param_type == "auto" and value == int(value) and not known_float):
                 old_value = await drone.param.get_param_int(name)
                 param_type_final = "int"
             else:
                 old_value = await drone.param.get_param_float(name)
                 param_type_final = "float"
-        except:
+        except ParamError:
             old_value = None
             # Assume float if we can't get old value
             param_type_final = "float" if param_type == "auto" else param_type
         
-        # Set new value
+        # Set new value (drop the list_parameters cache first, even if the set fails midway)
+        connector._param_cache = None
         if param_type_final == "int":
             log_mavlink_cmd("drone.param.set_param_int", name=name, value=int(value))
             await drone.param.set_param_int(name, int(value))
         else:
             log_mavlink_cmd("drone.param.set_param_float", name=name, value=float(value))
             await drone.param.set_param_float(name, float(value))
+        connector._param_types[name] = param_type_final
         
-        logger.info(f"{LogColors.SUCCESS}✓ Parameter {name} changed from {old_value} to {value}{LogColors.RESET}")
+        logger.info("%s✓ Parameter %s changed from %s to %s%s", LogColors.SUCCESS, name, old_value, value, LogColors.RESET)
         
         return {
             "status": "success",
@@ -3830,7 +4170,7 @@ async def set_parameter(ctx: Context, name: str, value: float, param_type: str =
             "warning": "Some parameters may require a reboot to take effect."
         }
     except Exception as e:
-        logger.error(f"{LogColors.ERROR}❌ TOOL ERROR - Failed to set parameter {name}: {e}{LogColors.RESET}")
+        logger.error("%s❌ TOOL ERROR - Failed to set parameter %s: %s%s", LogColors.ERROR, name, e, LogColors.RESET)
         return {
             "status": "failed", 
             "error": f"Failed to set parameter '{name}': {str(e)}",
@@ -3838,6 +4178,7 @@ async def set_parameter(ctx: Context, name: str, value: float, param_type: str =
         }
 
 @mcp.tool()
+@requires_connection
 async def list_parameters(ctx: Context, filter_prefix: str = "") -> dict:
     """
     List all available drone parameters.
@@ -3867,32 +4208,42 @@ async def list_parameters(ctx: Context, filter_prefix: str = "") -> dict:
         - COMPASS_ : Compass/magnetometer settings
         - GPS_ : GPS settings
     """
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
-    logger.info(f"Listing parameters{f' (filter: {filter_prefix}*)' if filter_prefix else ''}")
+    if filter_prefix:
+        logger.info("Listing parameters (filter: %s*)", filter_prefix)
+    else:
+        logger.info("Listing parameters")
     
     try:
-        log_mavlink_cmd("drone.param.get_all_params", filter_prefix=filter_prefix if filter_prefix else "none")
-        all_params = await drone.param.get_all_params()
+        cached = connector._param_cache
+        if cached is not None and time.monotonic() - cached[1] < PARAM_CACHE_TTL_S:
+            all_params = cached[0]
+        else:
+            log_mavlink_cmd("drone.param.get_all_params", filter_prefix=filter_prefix if filter_prefix else "none")
+            all_params = await drone.param.get_all_params()
+            connector._param_cache = (all_params, time.monotonic())
+        
+        # One pass over int and float params, each tagged with its type
+        typed_params = itertools.chain(
+            zip(all_params.int_params, itertools.repeat("int")),
+            zip(all_params.float_params, itertools.repeat("float")),
+        )
         
         # Filter if prefix provided
         if filter_prefix:
             filter_upper = filter_prefix.upper()
-            filtered = []
-            for param in all_params.int_params:
-                if param.name.upper().startswith(filter_upper):
-                    filtered.append({"name": param.name, "value": param.value, "type": "int"})
-            for param in all_params.float_params:
-                if param.name.upper().startswith(filter_upper):
-                    filtered.append({"name": param.name, "value": param.value, "type": "float"})
+            prefix_len = len(filter_upper)
+            # Only uppercase the part of each name that the prefix covers
+            filtered = [
+                {"name": param.name, "value": param.value, "type": param_kind}
+                for param, param_kind in typed_params
+                if param.name[:prefix_len].upper() == filter_upper
+            ]
             
-            filtered.sort(key=lambda x: x["name"])
-            logger.info(f"Found {len(filtered)} parameters matching '{filter_prefix}*'")
+            filtered.sort(key=operator.itemgetter("name"))
+            logger.info("Found %s parameters matching '%s*'", len(filtered), filter_prefix)
             
             return {
                 "status": "success",
@@ -3902,14 +4253,13 @@ async def list_parameters(ctx: Context, filter_prefix: str = "") -> dict:
             }
         else:
             # Return all parameters
-            params_list = []
-            for param in all_params.int_params:
-                params_list.append({"name": param.name, "value": param.value, "type": "int"})
-            for param in all_params.float_params:
-                params_list.append({"name": param.name, "value": param.value, "type": "float"})
+            params_list = [
+                {"name": param.name, "value": param.value, "type": param_kind}
+                for param, param_kind in typed_params
+            ]
             
-            params_list.sort(key=lambda x: x["name"])
-            logger.info(f"Found {len(params_list)} total parameters")
+            params_list.sort(key=operator.itemgetter("name"))
+            logger.info("Found %s total parameters", len(params_list))
             
             return {
                 "status": "success",
@@ -3918,13 +4268,14 @@ async def list_parameters(ctx: Context, filter_prefix: str = "") -> dict:
                 "warning": f"This is a large list ({len(params_list)} parameters). Consider using filter_prefix to narrow results."
             }
     except Exception as e:
-        logger.error(f"{LogColors.ERROR}❌ TOOL ERROR - Failed to list parameters: {e}{LogColors.RESET}")
+        logger.error("%s❌ TOOL ERROR - Failed to list parameters: %s%s", LogColors.ERROR, e, LogColors.RESET)
         return {"status": "failed", "error": f"Failed to retrieve parameters: {str(e)}"}
 
 # ============================================================================
 # v1.2.0: ADVANCED NAVIGATION
 # ============================================================================
 @mcp.tool()
+@requires_connection
 async def set_yaw(ctx: Context, yaw_deg: float, yaw_rate_deg_s: float = 30.0) -> dict:
     """
     Set the drone's heading (yaw) without changing position.
@@ -3953,11 +4304,7 @@ async def set_yaw(ctx: Context, yaw_deg: float, yaw_rate_deg_s: float = 30.0) ->
           (MAVSDK doesn't have a dedicated "yaw only" command)
     """
     log_tool_call("set_yaw", yaw_deg=yaw_deg, yaw_rate_deg_s=yaw_rate_deg_s)
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     # Normalize yaw to 0-360
     yaw_normalized = yaw_deg % 360
@@ -3967,52 +4314,58 @@ async def set_yaw(ctx: Context, yaw_deg: float, yaw_rate_deg_s: float = 30.0) ->
         return {"status": "failed", "error": f"Invalid yaw rate: {yaw_rate_deg_s}. Must be positive."}
     
     drone = connector.drone
-    logger.info(f"Setting yaw to {yaw_normalized}° at {yaw_rate_deg_s}°/s")
+    logger.info("Setting yaw to %s° at %s°/s", yaw_normalized, yaw_rate_deg_s)
     
     try:
         # WORKAROUND: MAVSDK doesn't have a "set yaw only" command
         # We use goto_location with current position + new yaw
         # This tells the drone to "fly to where you already are, but face this direction"
-        async for position in drone.telemetry.position():
-            current_lat = position.latitude_deg
-            current_lon = position.longitude_deg
-            current_alt = position.absolute_altitude_m
-            current_rel_alt = position.relative_altitude_m
-            
-            logger.info(f"Reading current position: ({current_lat:.6f}, {current_lon:.6f}) @ {current_rel_alt:.1f}m AGL")
-            logger.info(f"Commanding: same position, new yaw = {yaw_normalized}°")
-            
-            # Use goto_location with current position but new yaw
-            # This is the standard MAVSDK workaround for yaw-only control
-            log_mavlink_cmd("drone.action.goto_location", lat=f"{current_lat:.6f}", 
-                           lon=f"{current_lon:.6f}", alt=f"{current_alt:.1f}", 
-                           yaw=f"{yaw_normalized:.1f}")
-            await drone.action.goto_location(
-                current_lat,
-                current_lon,
-                current_alt,
-                yaw_normalized
-            )
-            
-            # Convert heading to cardinal direction
-            directions = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']
-            direction_index = int((yaw_normalized + 22.5) / 45) % 8
-            cardinal = directions[direction_index]
-            
-            logger.info(f"{LogColors.SUCCESS}✓ Yaw set to {yaw_normalized}° ({cardinal}){LogColors.RESET}")
-            
-            return {
-                "status": "success",
-                "message": f"Rotating to heading {yaw_normalized}°",
-                "yaw_degrees": yaw_normalized,
-                "cardinal_direction": cardinal,
-                "yaw_rate_deg_s": yaw_rate_deg_s
-            }
+        # The goto target is this position, so only use the cache if it is fresh
+        telemetry = connector.telemetry
+        if telemetry is not None and telemetry.get_age("position") <= telemetry.FRESH_THRESHOLD_S:
+            position = telemetry.get("position")
+        else:
+            position = await asyncio.wait_for(_first_value(drone.telemetry.position()), timeout=5.0)
+        current_lat = position.latitude_deg
+        current_lon = position.longitude_deg
+        current_alt = position.absolute_altitude_m
+        current_rel_alt = position.relative_altitude_m
+        
+        logger.info("Reading current position: (%.6f, %.6f) @ %.1fm AGL", current_lat, current_lon, current_rel_alt)
+        logger.info("Commanding: same position, new yaw = %s°", yaw_normalized)
+        
+        # Use goto_location with current position but new yaw
+        # This is the standard MAVSDK workaround for yaw-only control
+        log_mavlink_cmd("drone.action.goto_location", lat=f"{current_lat:.6f}", 
+                       lon=f"{current_lon:.6f}", alt=f"{current_alt:.1f}", 
+                       yaw=f"{yaw_normalized:.1f}")
+        await drone.action.goto_location(
+            current_lat,
+            current_lon,
+            current_alt,
+            yaw_normalized
+        )
+        
+        # Convert heading to cardinal direction
+        directions = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']
+        direction_index = int((yaw_normalized + 22.5) / 45) % 8
+        cardinal = directions[direction_index]
+        
+        logger.info("%s✓ Yaw set to %s° (%s)%s", LogColors.SUCCESS, yaw_normalized, cardinal, LogColors.RESET)
+        
+        return {
+            "status": "success",
+            "message": f"Rotating to heading {yaw_normalized}°",
+            "yaw_degrees": yaw_normalized,
+            "cardinal_direction": cardinal,
+            "yaw_rate_deg_s": yaw_rate_deg_s
+        }
     except Exception as e:
-        logger.error(f"Set yaw failed: {e}{LogColors.RESET}")
+        logger.error("Set yaw failed: %s%s", e, LogColors.RESET)
         return {"status": "failed", "error": f"Yaw control failed: {str(e)}"}
 
 @mcp.tool()
+@requires_connection
 async def reposition(
     ctx: Context,
     latitude_deg: float,
@@ -4042,23 +4395,18 @@ async def reposition(
         - Moving to better vantage point
         - Relocating between tasks
     """
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     # Validate coordinates
-    if not (-90 <= latitude_deg <= 90):
-        return {"status": "failed", "error": f"Invalid latitude: {latitude_deg}. Must be between -90 and 90."}
-    if not (-180 <= longitude_deg <= 180):
-        return {"status": "failed", "error": f"Invalid longitude: {longitude_deg}. Must be between -180 and 180."}
+    coordinate_error = _validate_coordinates(latitude_deg, longitude_deg)
+    if coordinate_error:
+        return coordinate_error
     
     drone = connector.drone
     
     try:
         # Get current position to calculate relative altitude for display
-        position = await drone.telemetry.position().__anext__()
+        position = await _first_value(drone.telemetry.position())
         home_alt = position.absolute_altitude_m - position.relative_altitude_m
         relative_alt = altitude_m - home_alt
         
@@ -4071,7 +4419,7 @@ async def reposition(
             latitude_deg,
             longitude_deg,
             altitude_m,
-            float('nan')  # Maintain current heading
+            _NAN  # Maintain current heading
         )
         
         return {
@@ -4093,6 +4441,7 @@ async def reposition(
 # ============================================================================
 
 @mcp.tool()
+@requires_connection
 async def upload_mission(ctx: Context, waypoints: list) -> dict:
     """
     Upload a mission to the drone WITHOUT starting it.
@@ -4127,11 +4476,7 @@ async def upload_mission(ctx: Context, waypoints: list) -> dict:
         Pass waypoints as a properly formatted list of dictionaries.
         Each waypoint MUST have: latitude_deg, longitude_deg, relative_altitude_m
     """
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     # Validate waypoints input
     if not waypoints:
@@ -4181,6 +4526,7 @@ async def upload_mission(ctx: Context, waypoints: list) -> dict:
         }
 
 @mcp.tool()
+@requires_connection
 async def download_mission(ctx: Context) -> dict:
     """
     Download the current mission from the drone.
@@ -4204,11 +4550,7 @@ async def download_mission(ctx: Context) -> dict:
         due to ArduPilot mission state synchronization. If this happens, wait a moment and
         try again, or use mission_progress() to verify the mission exists.
     """
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     logger.info("Downloading mission from drone")
@@ -4216,11 +4558,6 @@ async def download_mission(ctx: Context) -> dict:
     # Check mission progress first to verify mission exists
     try:
         log_mavlink_cmd("drone.mission.mission_progress")
-        async def _read_one(aiter, timeout=5.0):
-            async for item in aiter:
-                return item
-            return None
-
         progress = await asyncio.wait_for(_read_one(drone.mission.mission_progress()), timeout=5.0)
         if progress:
             logger.info(
@@ -4305,6 +4642,7 @@ async def download_mission(ctx: Context) -> dict:
                 }
 
 @mcp.tool()
+@requires_connection
 async def set_current_waypoint(ctx: Context, waypoint_index: int) -> dict:
     """
     Jump to a specific waypoint in the current mission.
@@ -4329,11 +4667,7 @@ async def set_current_waypoint(ctx: Context, waypoint_index: int) -> dict:
         - Re-survey specific area
         - Mission recovery after interruption
     """
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     if waypoint_index < 0:
         return {"status": "failed", "error": f"Invalid waypoint index: {waypoint_index}. Must be 0 or greater."}
@@ -4358,6 +4692,7 @@ async def set_current_waypoint(ctx: Context, waypoint_index: int) -> dict:
         return {"status": "failed", "error": f"Set waypoint failed: {str(e)}"}
 
 @mcp.tool()
+@requires_connection
 async def is_mission_finished(ctx: Context) -> dict:
     """
     Check if the current mission has completed.
@@ -4376,32 +4711,31 @@ async def is_mission_finished(ctx: Context) -> dict:
         - Mission automation
         - Status monitoring
     """
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     logger.info("Checking if mission is finished")
     
     try:
-        # Check mission finished status
+        # Check finished status, waypoint progress and flight mode concurrently
         log_mavlink_cmd("drone.mission.is_mission_finished")
-        finished = await drone.mission.is_mission_finished()
+        finished, mission_progress, flight_mode = await asyncio.gather(
+            drone.mission.is_mission_finished(),
+            _read_one(drone.mission.mission_progress()),
+            _first_value(drone.telemetry.flight_mode()),
+            return_exceptions=True,
+        )
+        for outcome in (finished, mission_progress):
+            if isinstance(outcome, BaseException):
+                raise outcome
         
-        # Get current waypoint progress
         current_wp = 0
         total_wp = 0
-        async for mission_progress in drone.mission.mission_progress():
+        if mission_progress:
             current_wp = mission_progress.current
             total_wp = mission_progress.total
-            break
         
-        # Get current flight mode
-        try:
-            flight_mode = await drone.telemetry.flight_mode().__anext__()
-        except:
+        if isinstance(flight_mode, BaseException):
             flight_mode = "UNKNOWN"
         
         status_text = "FINISHED" if finished else "IN PROGRESS"
@@ -4413,7 +4747,7 @@ async def is_mission_finished(ctx: Context) -> dict:
             "status_text": status_text,
             "current_waypoint": current_wp,
             "total_waypoints": total_wp,
-            "flight_mode": str(flight_mode),
+            "flight_mode": _enum_name(flight_mode),
             "progress_percentage": round((current_wp / total_wp * 100) if total_wp > 0 else 0, 1)
         }
     except Exception as e:
@@ -4426,6 +4760,7 @@ async def is_mission_finished(ctx: Context) -> dict:
 # ============================================================================
 
 @mcp.tool()
+@requires_connection
 async def get_health_all_ok(ctx: Context) -> dict:
     """
     Quick health check - returns True if ALL systems are OK for flight.
@@ -4442,34 +4777,31 @@ async def get_health_all_ok(ctx: Context) -> dict:
         dict: Boolean indicating if all systems pass health checks.
     """
     log_tool_call("get_health_all_ok")
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     logger.info("Checking if all systems are healthy")
     
     try:
-        async for health_all_ok in drone.telemetry.health_all_ok():
-            status_text = "ALL SYSTEMS GO ✓" if health_all_ok else "SYSTEMS NOT READY ✗"
-            logger.info(f"{LogColors.STATUS}Health check: {status_text}{LogColors.RESET}")
-            
-            result = {
-                "status": "success",
-                "health_all_ok": health_all_ok,
-                "status_text": status_text,
-                "recommendation": "Ready for flight" if health_all_ok else "Run get_health() for details on what's not ready"
-            }
-            log_tool_output(result)
-            return result
+        health_all_ok = await _single_flight(connector, "health_all_ok", lambda: _first_value(drone.telemetry.health_all_ok()))
+        status_text = "ALL SYSTEMS GO ✓" if health_all_ok else "SYSTEMS NOT READY ✗"
+        logger.info("%sHealth check: %s%s", LogColors.STATUS, status_text, LogColors.RESET)
+        
+        result = {
+            "status": "success",
+            "health_all_ok": health_all_ok,
+            "status_text": status_text,
+            "recommendation": "Ready for flight" if health_all_ok else "Run get_health() for details on what's not ready"
+        }
+        log_tool_output(result)
+        return result
     except Exception as e:
-        logger.error(f"{LogColors.ERROR}❌ TOOL ERROR - Failed to check health_all_ok: {e}{LogColors.RESET}")
+        logger.error("%s❌ TOOL ERROR - Failed to check health_all_ok: %s%s", LogColors.ERROR, e, LogColors.RESET)
         return {"status": "failed", "error": f"Health check failed: {str(e)}"}
 
 
 @mcp.tool()
+@requires_connection
 async def get_landed_state(ctx: Context) -> dict:
     """
     Get detailed landed state of the drone.
@@ -4485,50 +4817,48 @@ async def get_landed_state(ctx: Context) -> dict:
         dict: Landed state enum value and descriptive text.
     """
     log_tool_call("get_landed_state")
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     logger.info("Checking landed state")
     
     try:
-        async for landed_state in drone.telemetry.landed_state():
-            state_str = str(landed_state)
-            
-            # Map enum to human-readable description
-            state_descriptions = {
-                "UNKNOWN": "State cannot be determined",
-                "ON_GROUND": "Drone is on the ground, not moving",
-                "IN_AIR": "Drone is flying/airborne",
-                "TAKING_OFF": "Drone is in the process of taking off",
-                "LANDING": "Drone is in the process of landing"
-            }
-            
-            # Extract enum name from string representation
-            state_name = state_str.split(".")[-1] if "." in state_str else state_str
-            description = state_descriptions.get(state_name, state_str)
-            
-            logger.info(f"{LogColors.STATUS}Landed state: {state_name} - {description}{LogColors.RESET}")
-            
-            result = {
-                "status": "success",
-                "landed_state": state_name,
-                "description": description,
-                "is_on_ground": state_name == "ON_GROUND",
-                "is_in_air": state_name == "IN_AIR",
-                "is_transitioning": state_name in ["TAKING_OFF", "LANDING"]
-            }
-            log_tool_output(result)
-            return result
+        landed_state, age_s = await _read_telemetry_aged(connector, "landed_state", drone.telemetry.landed_state)
+        state_str = str(landed_state)
+        
+        # Map enum to human-readable description
+        state_descriptions = {
+            "UNKNOWN": "State cannot be determined",
+            "ON_GROUND": "Drone is on the ground, not moving",
+            "IN_AIR": "Drone is flying/airborne",
+            "TAKING_OFF": "Drone is in the process of taking off",
+            "LANDING": "Drone is in the process of landing"
+        }
+        
+        # Extract enum name from string representation
+        state_name = _enum_name(landed_state)
+        description = state_descriptions.get(state_name, state_str)
+        
+        logger.info("%sLanded state: %s - %s%s", LogColors.STATUS, state_name, description, LogColors.RESET)
+        
+        result = {
+            "status": "success",
+            "landed_state": state_name,
+            "description": description,
+            "is_on_ground": state_name == "ON_GROUND",
+            "is_in_air": state_name == "IN_AIR",
+            "is_transitioning": state_name in ["TAKING_OFF", "LANDING"],
+            "age_s": round(age_s, 2)
+        }
+        log_tool_output(result)
+        return result
     except Exception as e:
-        logger.error(f"{LogColors.ERROR}❌ TOOL ERROR - Failed to get landed state: {e}{LogColors.RESET}")
+        logger.error("%s❌ TOOL ERROR - Failed to get landed state: %s%s", LogColors.ERROR, e, LogColors.RESET)
         return {"status": "failed", "error": f"Landed state read failed: {str(e)}"}
 
 
 @mcp.tool()
+@requires_connection
 async def get_rc_status(ctx: Context) -> dict:
     """
     Get RC (Remote Control) controller connection status and signal strength.
@@ -4543,52 +4873,49 @@ async def get_rc_status(ctx: Context) -> dict:
         dict: RC availability status and signal strength percentage.
     """
     log_tool_call("get_rc_status")
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     logger.info("Checking RC controller status")
     
     try:
-        async for rc_status in drone.telemetry.rc_status():
-            is_available = rc_status.is_available
-            signal_strength = rc_status.signal_strength_percent
-            
-            # Determine signal quality
-            if not is_available:
-                quality = "NO RC CONNECTED"
-            elif signal_strength >= 80:
-                quality = "Excellent"
-            elif signal_strength >= 60:
-                quality = "Good"
-            elif signal_strength >= 40:
-                quality = "Fair"
-            elif signal_strength >= 20:
-                quality = "Poor"
-            else:
-                quality = "Critical - Link may be lost"
-            
-            status_text = f"RC {'Available' if is_available else 'Not Available'} - Signal: {signal_strength:.0f}% ({quality})"
-            logger.info(f"{LogColors.STATUS}RC Status: {status_text}{LogColors.RESET}")
-            
-            result = {
-                "status": "success",
-                "rc_available": is_available,
-                "signal_strength_percent": round(signal_strength, 1) if is_available else 0,
-                "signal_quality": quality,
-                "status_text": status_text
-            }
-            log_tool_output(result)
-            return result
+        rc_status = await _single_flight(connector, "rc_status", lambda: _first_value(drone.telemetry.rc_status()))
+        is_available = rc_status.is_available
+        signal_strength = rc_status.signal_strength_percent
+        
+        # Determine signal quality
+        if not is_available:
+            quality = "NO RC CONNECTED"
+        elif signal_strength >= 80:
+            quality = "Excellent"
+        elif signal_strength >= 60:
+            quality = "Good"
+        elif signal_strength >= 40:
+            quality = "Fair"
+        elif signal_strength >= 20:
+            quality = "Poor"
+        else:
+            quality = "Critical - Link may be lost"
+        
+        status_text = f"RC {'Available' if is_available else 'Not Available'} - Signal: {signal_strength:.0f}% ({quality})"
+        logger.info("%sRC Status: %s%s", LogColors.STATUS, status_text, LogColors.RESET)
+        
+        result = {
+            "status": "success",
+            "rc_available": is_available,
+            "signal_strength_percent": round(signal_strength, 1) if is_available else 0,
+            "signal_quality": quality,
+            "status_text": status_text
+        }
+        log_tool_output(result)
+        return result
     except Exception as e:
-        logger.error(f"{LogColors.ERROR}❌ TOOL ERROR - Failed to get RC status: {e}{LogColors.RESET}")
+        logger.error("%s❌ TOOL ERROR - Failed to get RC status: %s%s", LogColors.ERROR, e, LogColors.RESET)
         return {"status": "failed", "error": f"RC status read failed: {str(e)}"}
 
 
 @mcp.tool()
+@requires_connection
 async def get_heading(ctx: Context) -> dict:
     """
     Get the current compass heading of the drone in degrees.
@@ -4605,66 +4932,64 @@ async def get_heading(ctx: Context) -> dict:
         dict: Heading in degrees and cardinal direction.
     """
     log_tool_call("get_heading")
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     logger.info("Getting compass heading")
     
     try:
-        async for heading in drone.telemetry.heading():
-            heading_deg = heading.heading_deg
-            
-            # Normalize heading to 0-360
-            heading_normalized = heading_deg % 360
-            if heading_normalized < 0:
-                heading_normalized += 360
-            
-            # Determine cardinal direction
-            if heading_normalized >= 337.5 or heading_normalized < 22.5:
-                cardinal = "N"
-                direction = "North"
-            elif heading_normalized < 67.5:
-                cardinal = "NE"
-                direction = "Northeast"
-            elif heading_normalized < 112.5:
-                cardinal = "E"
-                direction = "East"
-            elif heading_normalized < 157.5:
-                cardinal = "SE"
-                direction = "Southeast"
-            elif heading_normalized < 202.5:
-                cardinal = "S"
-                direction = "South"
-            elif heading_normalized < 247.5:
-                cardinal = "SW"
-                direction = "Southwest"
-            elif heading_normalized < 292.5:
-                cardinal = "W"
-                direction = "West"
-            else:
-                cardinal = "NW"
-                direction = "Northwest"
-            
-            logger.info(f"{LogColors.STATUS}Heading: {heading_normalized:.1f}° ({direction}){LogColors.RESET}")
-            
-            result = {
-                "status": "success",
-                "heading_deg": round(heading_normalized, 1),
-                "cardinal_direction": cardinal,
-                "direction_name": direction
-            }
-            log_tool_output(result)
-            return result
+        heading, age_s = await _read_telemetry_aged(connector, "heading", drone.telemetry.heading)
+        heading_deg = heading.heading_deg
+        
+        # Normalize heading to 0-360
+        heading_normalized = heading_deg % 360
+        if heading_normalized < 0:
+            heading_normalized += 360
+        
+        # Determine cardinal direction
+        if heading_normalized >= 337.5 or heading_normalized < 22.5:
+            cardinal = "N"
+            direction = "North"
+        elif heading_normalized < 67.5:
+            cardinal = "NE"
+            direction = "Northeast"
+        elif heading_normalized < 112.5:
+            cardinal = "E"
+            direction = "East"
+        elif heading_normalized < 157.5:
+            cardinal = "SE"
+            direction = "Southeast"
+        elif heading_normalized < 202.5:
+            cardinal = "S"
+            direction = "South"
+        elif heading_normalized < 247.5:
+            cardinal = "SW"
+            direction = "Southwest"
+        elif heading_normalized < 292.5:
+            cardinal = "W"
+            direction = "West"
+        else:
+            cardinal = "NW"
+            direction = "Northwest"
+        
+        logger.info("%sHeading: %.1f° (%s)%s", LogColors.STATUS, heading_normalized, direction, LogColors.RESET)
+        
+        result = {
+            "status": "success",
+            "heading_deg": round(heading_normalized, 1),
+            "cardinal_direction": cardinal,
+            "direction_name": direction,
+            "age_s": round(age_s, 2)
+        }
+        log_tool_output(result)
+        return result
     except Exception as e:
-        logger.error(f"{LogColors.ERROR}❌ TOOL ERROR - Failed to get heading: {e}{LogColors.RESET}")
+        logger.error("%s❌ TOOL ERROR - Failed to get heading: %s%s", LogColors.ERROR, e, LogColors.RESET)
         return {"status": "failed", "error": f"Heading read failed: {str(e)}"}
 
 
 @mcp.tool()
+@requires_connection
 async def get_odometry(ctx: Context) -> dict:
     """
     Get combined odometry data: position, velocity, and orientation.
@@ -4684,89 +5009,88 @@ async def get_odometry(ctx: Context) -> dict:
         dict: Combined position, velocity, and orientation data.
     """
     log_tool_call("get_odometry")
-    connector = ctx.request_context.lifespan_context
-    
-    # Wait for connection
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout. Please wait and try again."}
+    connector = _get_connector(ctx)
     
     drone = connector.drone
     logger.info("Getting odometry data")
     
     try:
-        async for odometry in drone.telemetry.odometry():
-            # Extract position (NED frame)
-            position = {
-                "north_m": round(odometry.position_body.x_m, 3),
-                "east_m": round(odometry.position_body.y_m, 3),
-                "down_m": round(odometry.position_body.z_m, 3),
-            }
-            
-            # Extract velocity (body frame)
-            velocity = {
-                "forward_m_s": round(odometry.velocity_body.x_m_s, 3),
-                "right_m_s": round(odometry.velocity_body.y_m_s, 3),
-                "down_m_s": round(odometry.velocity_body.z_m_s, 3),
-            }
-            
-            # Extract orientation quaternion
-            quaternion = {
-                "w": round(odometry.q.w, 4),
-                "x": round(odometry.q.x, 4),
-                "y": round(odometry.q.y, 4),
-                "z": round(odometry.q.z, 4),
-            }
-            
-            # Convert quaternion to Euler angles for easier interpretation
-            # Using standard aerospace convention (roll, pitch, yaw)
-            w, x, y, z = odometry.q.w, odometry.q.x, odometry.q.y, odometry.q.z
-            
-            # Roll (rotation around x-axis)
-            sinr_cosp = 2 * (w * x + y * z)
-            cosr_cosp = 1 - 2 * (x * x + y * y)
-            roll_rad = math.atan2(sinr_cosp, cosr_cosp)
-            
-            # Pitch (rotation around y-axis)
-            sinp = 2 * (w * y - z * x)
-            if abs(sinp) >= 1:
-                pitch_rad = math.copysign(math.pi / 2, sinp)  # Use 90 degrees if out of range
-            else:
-                pitch_rad = math.asin(sinp)
-            
-            # Yaw (rotation around z-axis)
-            siny_cosp = 2 * (w * z + x * y)
-            cosy_cosp = 1 - 2 * (y * y + z * z)
-            yaw_rad = math.atan2(siny_cosp, cosy_cosp)
-            
-            euler_angles = {
-                "roll_deg": round(math.degrees(roll_rad), 2),
-                "pitch_deg": round(math.degrees(pitch_rad), 2),
-                "yaw_deg": round(math.degrees(yaw_rad), 2),
-            }
-            
-            # Calculate derived values
-            ground_speed = math.sqrt(velocity["forward_m_s"]**2 + velocity["right_m_s"]**2)
-            total_speed = math.sqrt(ground_speed**2 + velocity["down_m_s"]**2)
-            
-            logger.info(f"{LogColors.STATUS}Odometry: Pos({position['north_m']:.1f}N, {position['east_m']:.1f}E, {-position['down_m']:.1f}Up) "
-                       f"Vel({ground_speed:.1f}m/s ground) Yaw({euler_angles['yaw_deg']:.0f}°){LogColors.RESET}")
-            
-            result = {
-                "status": "success",
-                "frame_id": str(odometry.frame_id),
-                "child_frame_id": str(odometry.child_frame_id),
-                "position_ned_m": position,
-                "velocity_body_m_s": velocity,
-                "orientation_quaternion": quaternion,
-                "euler_angles_deg": euler_angles,
-                "ground_speed_m_s": round(ground_speed, 2),
-                "total_speed_m_s": round(total_speed, 2),
-                "altitude_m": round(-position["down_m"], 2)  # Convert down to up (altitude)
-            }
-            log_tool_output(result)
-            return result
+        odometry = await _single_flight(connector, "odometry", lambda: _first_value(drone.telemetry.odometry()))
+        # Extract position (NED frame)
+        position = {
+            "north_m": round(odometry.position_body.x_m, 3),
+            "east_m": round(odometry.position_body.y_m, 3),
+            "down_m": round(odometry.position_body.z_m, 3),
+        }
+        
+        # Extract velocity (body frame)
+        velocity = {
+            "forward_m_s": round(odometry.velocity_body.x_m_s, 3),
+            "right_m_s": round(odometry.velocity_body.y_m_s, 3),
+            "down_m_s": round(odometry.velocity_body.z_m_s, 3),
+        }
+        
+        # Extract orientation quaternion
+        quaternion = {
+            "w": round(odometry.q.w, 4),
+            "x": round(odometry.q.x, 4),
+            "y": round(odometry.q.y, 4),
+            "z": round(odometry.q.z, 4),
+        }
+        
+        # Convert quaternion to Euler angles for easier interpretation
+        # Using standard aerospace convention (roll, pitch, yaw)
+        w, x, y, z = odometry.q.w, odometry.q.x, odometry.q.y, odometry.q.z
+        
+        # Roll (rotation around x-axis)
+        sinr_cosp = 2 * (w * x + y * z)
+        cosr_cosp = 1 - 2 * (x * x + y * y)
+        roll_rad = math.atan2(sinr_cosp, cosr_cosp)
+        
+        # Pitch (rotation around y-axis)
+        sinp = 2 * (w * y - z * x)
+        if abs(sinp) >= 1:
+            pitch_rad = math.copysign(math.pi / 2, sinp)  # Use 90 degrees if out of range
+        else:
+            pitch_rad = math.asin(sinp)
+        
+        # Yaw (rotation around z-axis)
+        siny_cosp = 2 * (w * z + x * y)
+        cosy_cosp = 1 - 2 * (y * y + z * z)
+        yaw_rad = math.atan2(siny_cosp, cosy_cosp)
+        
+        euler_angles = {
+            "roll_deg": round(math.degrees(roll_rad), 2),
+            "pitch_deg": round(math.degrees(pitch_rad), 2),
+            "yaw_deg": round(math.degrees(yaw_rad), 2),
+        }
+        
+        # Calculate derived values
+        ground_speed = math.hypot(velocity["forward_m_s"], velocity["right_m_s"])
+        total_speed = math.hypot(ground_speed, velocity["down_m_s"])
+        
+        logger.info(
+            "%sOdometry: Pos(%.1fN, %.1fE, %.1fUp) Vel(%.1fm/s ground) Yaw(%.0f°)%s", LogColors.STATUS,
+            position['north_m'], position['east_m'], -position['down_m'],
+            ground_speed, euler_angles['yaw_deg'], LogColors.RESET,
+        )
+        
+        result = {
+            "status": "success",
+            "frame_id": str(odometry.frame_id),
+            "child_frame_id": str(odometry.child_frame_id),
+            "position_ned_m": position,
+            "velocity_body_m_s": velocity,
+            "orientation_quaternion": quaternion,
+            "euler_angles_deg": euler_angles,
+            "ground_speed_m_s": round(ground_speed, 2),
+            "total_speed_m_s": round(total_speed, 2),
+            "altitude_m": round(-position["down_m"], 2)  # Convert down to up (altitude)
+        }
+        log_tool_output(result)
+        return result
     except Exception as e:
-        logger.error(f"{LogColors.ERROR}❌ TOOL ERROR - Failed to get odometry: {e}{LogColors.RESET}")
+        logger.error("%s❌ TOOL ERROR - Failed to get odometry: %s%s", LogColors.ERROR, e, LogColors.RESET)
         return {"status": "failed", "error": f"Odometry read failed: {str(e)}"}
 
 
@@ -4793,7 +5117,7 @@ async def create_mission(ctx: Context, type: str, objective: str, area: dict, pa
         dict with mission ID and initial state
     """
     log_tool_call("create_mission", type=type, objective=objective, area=area, params=params)
-    connector = ctx.request_context.lifespan_context
+    connector = _get_connector(ctx)
 
     mission_id = f"mission-{uuid.uuid4().hex[:8]}"
     mission = MissionState(
@@ -4831,7 +5155,7 @@ async def get_mission_state(ctx: Context) -> dict:
         dict with full mission state or error if no active mission
     """
     log_tool_call("get_mission_state")
-    connector = ctx.request_context.lifespan_context
+    connector = _get_connector(ctx)
 
     if connector.current_mission is None:
         result = {"status": "failed", "error": "No active mission. Use create_mission first."}
@@ -4858,7 +5182,7 @@ async def get_mission_summary(ctx: Context) -> dict:
         dict with summary string
     """
     log_tool_call("get_mission_summary")
-    connector = ctx.request_context.lifespan_context
+    connector = _get_connector(ctx)
 
     if connector.current_mission is None:
         result = {"status": "failed", "error": "No active mission. Use create_mission first."}
@@ -4887,7 +5211,7 @@ async def update_mission_progress(ctx: Context, sector_id: str, status: str) ->
         dict with updated sector info
     """
     log_tool_call("update_mission_progress", sector_id=sector_id, status=status)
-    connector = ctx.request_context.lifespan_context
+    connector = _get_connector(ctx)
 
     if connector.current_mission is None:
         result = {"status": "failed", "error": "No active mission."}
@@ -4940,7 +5264,7 @@ async def add_finding(
         dict with finding ID
     """
     log_tool_call("add_finding", type=type, lat=lat, lon=lon, confidence=confidence, metadata=metadata, image_ref=image_ref)
-    connector = ctx.request_context.lifespan_context
+    connector = _get_connector(ctx)
 
     if connector.current_mission is None:
         result = {"status": "failed", "error": "No active mission."}
@@ -4988,7 +5312,7 @@ async def log_decision(ctx: Context, trigger: str, action: str, rationale: str)
         dict confirming decision logged
     """
     log_tool_call("log_decision", trigger=trigger, action=action, rationale=rationale)
-    connector = ctx.request_context.lifespan_context
+    connector = _get_connector(ctx)
 
     if connector.current_mission is None:
         result = {"status": "failed", "error": "No active mission."}
@@ -5012,6 +5336,7 @@ async def log_decision(ctx: Context, trigger: str, action: str, rationale: str)
 # ============================================================
 
 @mcp.tool()
+@requires_connection
 async def execute_grid_search(
     ctx: Context, bounds: dict, altitude: float, spacing: float, objective: str = "Grid search"
 ) -> dict:
@@ -5032,10 +5357,7 @@ async def execute_grid_search(
         dict with mission state, waypoint count, estimated flight info
     """
     log_tool_call("execute_grid_search", bounds=bounds, altitude=altitude, spacing=spacing, objective=objective)
-    connector = ctx.request_context.lifespan_context
-
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout."}
+    connector = _get_connector(ctx)
 
     # Validate bounds
     required_keys = ["north", "south", "east", "west"]
@@ -5128,6 +5450,7 @@ async def execute_grid_search(
 
 
 @mcp.tool()
+@requires_connection
 async def execute_expanding_square(
     ctx: Context, center_lat: float, center_lon: float,
     altitude: float, initial_size: float = 50.0, expansion: float = 50.0,
@@ -5153,10 +5476,7 @@ async def execute_expanding_square(
     """
     log_tool_call("execute_expanding_square", center_lat=center_lat, center_lon=center_lon,
                   altitude=altitude, initial_size=initial_size, expansion=expansion, legs=legs, objective=objective)
-    connector = ctx.request_context.lifespan_context
-
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout."}
+    connector = _get_connector(ctx)
 
     waypoints, sectors = generate_expanding_square_waypoints(
         center_lat, center_lon, altitude, initial_size, expansion, legs
@@ -5233,6 +5553,7 @@ async def execute_expanding_square(
 
 
 @mcp.tool()
+@requires_connection
 async def execute_sector_search(
     ctx: Context, center_lat: float, center_lon: float,
     radius: float, altitude: float, num_sectors: int = 6,
@@ -5257,10 +5578,7 @@ async def execute_sector_search(
     """
     log_tool_call("execute_sector_search", center_lat=center_lat, center_lon=center_lon,
                   radius=radius, altitude=altitude, num_sectors=num_sectors, objective=objective)
-    connector = ctx.request_context.lifespan_context
-
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout."}
+    connector = _get_connector(ctx)
 
     waypoints, sectors = generate_sector_search_waypoints(
         center_lat, center_lon, radius, altitude, num_sectors
@@ -5354,7 +5672,7 @@ async def monitor_search_progress(ctx: Context) -> dict:
         dict with mission progress, current sector, telemetry, and overall state
     """
     log_tool_call("monitor_search_progress")
-    connector = ctx.request_context.lifespan_context
+    connector = _get_connector(ctx)
 
     if connector.current_mission is None:
         result = {"status": "failed", "error": "No active mission."}
@@ -5383,11 +5701,6 @@ async def monitor_search_progress(ctx: Context) -> dict:
             battery_pct = snapshot["battery_pct"] if snapshot["battery_pct"] != -1 else None
             flight_mode = snapshot["flight_mode"]
         else:
-            async def _read_one(aiter, timeout=5.0):
-                async for item in aiter:
-                    return item
-                return None
-
             current_wp = 0
             total_wp = 0
             try:
@@ -5422,7 +5735,7 @@ async def monitor_search_progress(ctx: Context) -> dict:
             try:
                 fm = await asyncio.wait_for(_read_one(drone.telemetry.flight_mode()), timeout=5.0)
                 if fm:
-                    flight_mode = str(fm).split(".")[-1]
+                    flight_mode = _enum_name(fm)
             except (asyncio.TimeoutError, Exception):
                 pass
 
@@ -5576,6 +5889,7 @@ def _get_position_data(connector) -> dict:
 
 
 @mcp.tool()
+@requires_connection
 async def capture_image(ctx: Context, label: str = "", camera_name: str = "front_center",
                         image_type: str = "scene") -> dict:
     """Capture an image from the drone's camera.
@@ -5592,10 +5906,7 @@ async def capture_image(ctx: Context, label: str = "", camera_name: str = "front
         dict with image_ref, position metadata, and source info
     """
     log_tool_call("capture_image", label=label, camera_name=camera_name, image_type=image_type)
-    connector = ctx.request_context.lifespan_context
-
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout."}
+    connector = _get_connector(ctx)
 
     position_data = _get_position_data(connector)
     mission_id = connector.current_mission.id if connector.current_mission else "no-mission"
@@ -5655,6 +5966,7 @@ async def set_camera_pose(ctx: Context, camera_name: str = "front_center",
 
 
 @mcp.tool()
+@requires_connection
 async def capture_multi_camera(ctx: Context, label: str = "",
                                 cameras: str = "front_center,bottom_center") -> dict:
     """Capture images from multiple cameras simultaneously.
@@ -5669,10 +5981,7 @@ async def capture_multi_camera(ctx: Context, label: str = "",
     """
     camera_list = [c.strip() for c in cameras.split(",") if c.strip()]
     log_tool_call("capture_multi_camera", label=label, cameras=camera_list)
-    connector = ctx.request_context.lifespan_context
-
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout."}
+    connector = _get_connector(ctx)
 
     position_data = _get_position_data(connector)
     mission_id = connector.current_mission.id if connector.current_mission else "no-mission"
@@ -5739,7 +6048,7 @@ async def analyze_image(ctx: Context, image_ref: str, prompt: str = "",
     """
     log_tool_call("analyze_image", image_ref=image_ref, prompt=prompt,
                   auto_add_finding=auto_add_finding)
-    connector = ctx.request_context.lifespan_context
+    connector = _get_connector(ctx)
 
     try:
         client = _get_perception_client()
@@ -5816,7 +6125,7 @@ async def get_findings_near(ctx: Context, lat: float, lon: float, radius_m: floa
         dict with matching findings sorted by distance
     """
     log_tool_call("get_findings_near", lat=lat, lon=lon, radius_m=radius_m)
-    connector = ctx.request_context.lifespan_context
+    connector = _get_connector(ctx)
 
     if connector.current_mission is None:
         result = {"status": "failed", "error": "No active mission."}
@@ -5917,6 +6226,7 @@ async def capture_and_analyze(ctx: Context, label: str = "", camera_name: str =
 # ============================================================
 
 @mcp.tool()
+@requires_connection
 async def fly_waypoint_route(
     ctx: Context, waypoints: list[dict], altitude: float, speed: float = 5.0
 ) -> dict:
@@ -5936,10 +6246,7 @@ async def fly_waypoint_route(
         dict with waypoint count and estimated total distance
     """
     log_tool_call("fly_waypoint_route", waypoint_count=len(waypoints), altitude=altitude, speed=speed)
-    connector = ctx.request_context.lifespan_context
-
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout."}
+    connector = _get_connector(ctx)
 
     if len(waypoints) < 2:
         return {"status": "failed", "error": "Need at least 2 waypoints."}
@@ -6019,6 +6326,7 @@ async def fly_waypoint_route(
 
 
 @mcp.tool()
+@requires_connection
 async def orbit_point(
     ctx: Context, lat: float, lon: float, radius: float,
     altitude: float, laps: int = 1, speed: float = 5.0
@@ -6041,10 +6349,7 @@ async def orbit_point(
         dict with orbit parameters and waypoint count
     """
     log_tool_call("orbit_point", lat=lat, lon=lon, radius=radius, altitude=altitude, laps=laps, speed=speed)
-    connector = ctx.request_context.lifespan_context
-
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout."}
+    connector = _get_connector(ctx)
 
     if radius < 5:
         return {"status": "failed", "error": "Radius must be at least 5 meters."}
@@ -6127,6 +6432,7 @@ async def orbit_point(
 
 
 @mcp.tool()
+@requires_connection
 async def set_geofence(ctx: Context, bounds: dict) -> dict:
     """Set an inclusion geofence boundary.
 
@@ -6141,10 +6447,7 @@ async def set_geofence(ctx: Context, bounds: dict) -> dict:
         dict with geofence parameters
     """
     log_tool_call("set_geofence", bounds=bounds)
-    connector = ctx.request_context.lifespan_context
-
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout."}
+    connector = _get_connector(ctx)
 
     required_keys = ["north", "south", "east", "west"]
     missing = [k for k in required_keys if k not in bounds]
@@ -6182,6 +6485,7 @@ async def set_geofence(ctx: Context, bounds: dict) -> dict:
 
 
 @mcp.tool()
+@requires_connection
 async def clear_geofence(ctx: Context) -> dict:
     """Clear all geofence boundaries.
 
@@ -6194,10 +6498,7 @@ async def clear_geofence(ctx: Context) -> dict:
         dict confirming geofence cleared
     """
     log_tool_call("clear_geofence")
-    connector = ctx.request_context.lifespan_context
-
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout."}
+    connector = _get_connector(ctx)
 
     drone = connector.drone
     try:
@@ -6214,6 +6515,7 @@ async def clear_geofence(ctx: Context) -> dict:
 
 
 @mcp.tool()
+@requires_connection
 async def return_to_launch_if_low_battery(ctx: Context, threshold: float = 20.0) -> dict:
     """Start a background battery monitor that triggers RTL if battery drops below threshold.
 
@@ -6228,10 +6530,7 @@ async def return_to_launch_if_low_battery(ctx: Context, threshold: float = 20.0)
         dict confirming monitor started
     """
     log_tool_call("return_to_launch_if_low_battery", threshold=threshold)
-    connector = ctx.request_context.lifespan_context
-
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout."}
+    connector = _get_connector(ctx)
 
     if threshold < 5 or threshold > 80:
         return {"status": "failed", "error": "Threshold must be between 5 and 80 percent."}
@@ -6257,11 +6556,7 @@ async def return_to_launch_if_low_battery(ctx: Context, threshold: float = 20.0)
                         bat = connector.telemetry.get("battery")
                         pct = bat.remaining_percent * 100 if bat else None
                     else:
-                        async def _read_battery():
-                            async for bat in drone.telemetry.battery():
-                                return bat
-                            return None
-                        bat_obj = await asyncio.wait_for(_read_battery(), timeout=5.0)
+                        bat_obj = await asyncio.wait_for(_read_one(drone.telemetry.battery()), timeout=5.0)
                         pct = bat_obj.remaining_percent * 100 if bat_obj else None
 
                     if pct is not None and pct < threshold_pct:
@@ -6314,11 +6609,6 @@ async def build_activity_snapshot(connector: MAVLinkConnector, *, log_response:
         is_on_ground = snapshot["is_on_ground"]
     else:
         # Fallback: direct MAVSDK reads (only if TelemetryService not available)
-        async def _read_one(aiter, timeout=5.0):
-            async for item in aiter:
-                return item
-            return None
-
         telemetry = {}
         try:
             pos = await asyncio.wait_for(_read_one(drone.telemetry.position()), timeout=5.0)
@@ -6334,7 +6624,7 @@ async def build_activity_snapshot(connector: MAVLinkConnector, *, log_response:
 
         try:
             fm = await asyncio.wait_for(_read_one(drone.telemetry.flight_mode()), timeout=5.0)
-            flight_mode = str(fm).split(".")[-1] if fm else "UNKNOWN"
+            flight_mode = _enum_name(fm) if fm else "UNKNOWN"
             telemetry["flight_mode"] = flight_mode
         except asyncio.TimeoutError:
             flight_mode = "UNKNOWN"
@@ -6349,7 +6639,7 @@ async def build_activity_snapshot(connector: MAVLinkConnector, *, log_response:
         try:
             vel = await asyncio.wait_for(_read_one(drone.telemetry.velocity_ned()), timeout=5.0)
             if vel:
-                speed = math.sqrt(vel.north_m_s**2 + vel.east_m_s**2)
+                speed = math.hypot(vel.north_m_s, vel.east_m_s)
                 telemetry["speed_m_s"] = round(speed, 1)
             else:
                 telemetry["speed_m_s"] = None
@@ -6360,7 +6650,7 @@ async def build_activity_snapshot(connector: MAVLinkConnector, *, log_response:
         is_on_ground = False
         try:
             ls = await asyncio.wait_for(_read_one(drone.telemetry.landed_state()), timeout=5.0)
-            landed_state = str(ls).split(".")[-1] if ls else "UNKNOWN"
+            landed_state = _enum_name(ls) if ls else "UNKNOWN"
             is_on_ground = landed_state == "ON_GROUND"
         except asyncio.TimeoutError:
             pass
@@ -6589,11 +6879,7 @@ async def build_activity_snapshot(connector: MAVLinkConnector, *, log_response:
             total_wp = execution.last_observed_progress.get("total", 0)
         else:
             try:
-                async def _read_mp(aiter, timeout=5.0):
-                    async for item in aiter:
-                        return item
-                    return None
-                progress = await asyncio.wait_for(_read_mp(drone.mission.mission_progress()), timeout=5.0)
+                progress = await asyncio.wait_for(_read_one(drone.mission.mission_progress()), timeout=5.0)
                 if progress:
                     current_wp = progress.current
                     total_wp = progress.total
@@ -6699,6 +6985,7 @@ async def build_activity_snapshot(connector: MAVLinkConnector, *, log_response:
 
 
 @mcp.tool()
+@requires_connection
 async def get_drone_activity(ctx: Context) -> dict:
     """Get unified snapshot of current drone activity, telemetry, and mission state.
 
@@ -6717,14 +7004,19 @@ async def get_drone_activity(ctx: Context) -> dict:
     Uses cached telemetry streams — response time is <100ms.
     """
     log_tool_call("get_drone_activity")
-    connector = ctx.request_context.lifespan_context
-
-    if not await ensure_connection(connector):
-        return {"status": "failed", "error": "Drone connection timeout."}
+    connector = _get_connector(ctx)
 
     return await build_activity_snapshot(connector, log_response=True)
 
 
 if __name__ == "__main__":
+    # Use uvloop when it is installed (uvicorn does the same for the HTTP server)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        pass
+
     # Run the server
     mcp.run(transport='stdio')
@@ -28,14 +28,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 PORT = int(os.environ.get("MCP_PORT", "8080"))
 HOST = os.environ.get("MCP_HOST", "0.0.0.0")
 
-# Load environment variables
-from dotenv import load_dotenv
-env_path = Path(__file__).parent.parent.parent / '.env'
-load_dotenv(dotenv_path=env_path)
-
-# Now import after env vars are set
+# droneserver loads .env on import; no need to parse it twice here
 from src.server.droneserver import (
-    logger, mcp, get_or_create_global_connector, LogColors, build_activity_snapshot,
+    logger, mcp, get_or_create_global_connector, shutdown_drone_connection, LogColors,
+    build_activity_snapshot,
 )
 
 from starlette.applications import Starlette
@@ -147,12 +143,15 @@ async def ws_telemetry(websocket: WebSocket):
 
 @asynccontextmanager
 async def app_lifespan(app):
-    """Initialize the global drone connector on startup."""
+    """Initialize the global drone connector on startup and tear it down on exit."""
     logger.info("Initializing drone connection (parent app lifespan)...")
     async with mcp.session_manager.run():
         await get_or_create_global_connector()
-        yield
-    logger.info("Server shutting down")
+        try:
+            yield
+        finally:
+            logger.info("Server shutting down")
+            await shutdown_drone_connection()
 
 
 def create_app() -> Starlette:
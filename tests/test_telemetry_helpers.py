@@ -0,0 +1,227 @@
+"""Tests for the telemetry read helpers in droneserver.py, using fake MAVSDK streams."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.server import droneserver
+from src.server.droneserver import (
+    MAVLinkConnector,
+    TelemetryCacheEntry,
+    TelemetryService,
+    _read_telemetry_aged,
+    _single_flight,
+    _wait_for_flight_mode,
+)
+
+
+async def _stalled():
+    """Stream that never yields, like a dead link."""
+    await asyncio.sleep(3600)
+    yield None
+
+
+def _stream(*values, interval=0.0):
+    """Return a stream factory yielding ``values`` ``interval`` seconds apart."""
+    async def gen():
+        for value in values:
+            await asyncio.sleep(interval)
+            yield value
+    return gen
+
+
+def _connector_with_cache(name, value, age):
+    """Connector whose TelemetryService holds ``value`` for ``name``, ``age`` seconds old."""
+    service = TelemetryService(SimpleNamespace(telemetry=None, mission=None))
+    service._cache[name] = TelemetryCacheEntry(value=value, updated_at=time.time() - age)
+    return MAVLinkConnector(drone=None, telemetry=service)
+
+
+# ----------------------------------------------------------------------------
+# _read_telemetry_aged
+# ----------------------------------------------------------------------------
+
+async def test_read_telemetry_serves_fresh_cache_with_age():
+    connector = _connector_with_cache("armed", True, age=2.0)
+    value, age_s = await _read_telemetry_aged(connector, "armed", _stalled)
+    assert value is True
+    assert 2.0 <= age_s < 3.0
+
+
+async def test_read_telemetry_falls_back_to_live_read_when_stale():
+    connector = _connector_with_cache("armed", True, age=TelemetryService.STALE_THRESHOLD_S + 5)
+    value, age_s = await _read_telemetry_aged(connector, "armed", _stream(False))
+    assert value is False
+    assert age_s == 0.0
+
+
+async def test_read_telemetry_without_service_reads_live():
+    connector = MAVLinkConnector(drone=None)
+    value, age_s = await _read_telemetry_aged(connector, "in_air", _stream(True))
+    assert value is True
+    assert age_s == 0.0
+
+
+# ----------------------------------------------------------------------------
+# _single_flight
+# ----------------------------------------------------------------------------
+
+async def test_single_flight_shares_one_read():
+    connector = MAVLinkConnector(drone=None)
+    calls = 0
+
+    async def read():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return 42
+
+    results = await asyncio.gather(*(_single_flight(connector, "key", read) for _ in range(5)))
+    assert results == [42] * 5
+    assert calls == 1
+    assert connector._inflight == {}
+
+
+async def test_single_flight_timeout_releases_key_and_closes_stream(monkeypatch):
+    monkeypatch.setattr(droneserver, "SINGLE_FLIGHT_TIMEOUT_S", 0.1)
+    connector = MAVLinkConnector(drone=None)
+    closed = False
+
+    async def stalled():
+        nonlocal closed
+        try:
+            await asyncio.sleep(3600)
+            yield None
+        finally:
+            closed = True
+
+    with pytest.raises(asyncio.TimeoutError):
+        await _single_flight(connector, "key", lambda: droneserver._first_value(stalled()))
+    assert closed
+    assert connector._inflight == {}
+
+    # The next caller gets a fresh read instead of the hung one
+    assert await _single_flight(connector, "key", lambda: droneserver._first_value(_stream(7)())) == 7
+
+
+async def test_single_flight_caller_cancel_keeps_read_for_others():
+    connector = MAVLinkConnector(drone=None)
+
+    async def read():
+        await asyncio.sleep(0.05)
+        return "value"
+
+    first = asyncio.create_task(_single_flight(connector, "key", read))
+    second = asyncio.create_task(_single_flight(connector, "key", read))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == "value"
+
+
+# ----------------------------------------------------------------------------
+# _wait_for_flight_mode
+# ----------------------------------------------------------------------------
+
+def _drone_with_modes(*modes, interval=0.01):
+    return SimpleNamespace(telemetry=SimpleNamespace(flight_mode=_stream(*modes, interval=interval)))
+
+
+async def test_wait_for_flight_mode_returns_on_expected_mode():
+    drone = _drone_with_modes("POSCTL", "HOLD", "LAND")
+    assert await _wait_for_flight_mode(drone, {"HOLD"}, timeout=1.0) == "HOLD"
+
+
+async def test_wait_for_flight_mode_without_expected_waits_for_change():
+    drone = _drone_with_modes("HOLD", "HOLD", "OFFBOARD")
+    assert await _wait_for_flight_mode(drone, set(), previous="HOLD", timeout=1.0) == "OFFBOARD"
+
+
+async def test_wait_for_flight_mode_timeout_returns_last_seen():
+    drone = _drone_with_modes("POSCTL", "POSCTL", interval=0.05)
+    start = time.monotonic()
+    assert await _wait_for_flight_mode(drone, {"HOLD"}, timeout=0.2) == "POSCTL"
+    assert time.monotonic() - start < 0.5
+
+
+async def test_wait_for_flight_mode_no_samples_returns_none():
+    drone = SimpleNamespace(telemetry=SimpleNamespace(flight_mode=_stalled))
+    assert await _wait_for_flight_mode(drone, {"HOLD"}, timeout=0.05) is None
+
+
+# ----------------------------------------------------------------------------
+# TelemetryService.wait_newer
+# ----------------------------------------------------------------------------
+
+async def test_wait_newer_returns_next_update():
+    async def status_text():
+        for text in ("a", "b"):
+            await asyncio.sleep(0.05)
+            yield text
+        await asyncio.sleep(3600)
+
+    drone = SimpleNamespace(telemetry=SimpleNamespace(status_text=status_text))
+    service = TelemetryService(drone)
+    service._tasks["status_text"] = asyncio.create_task(
+        service._stream_loop("status_text", drone.telemetry.status_text)
+    )
+    try:
+        first = await service.wait_newer("status_text", after=0.0, timeout=1.0)
+        second = await service.wait_newer("status_text", after=first.updated_at, timeout=1.0)
+        assert (first.value, second.value) == ("a", "b")
+        assert await service.wait_newer("status_text", after=second.updated_at, timeout=0.1) is None
+    finally:
+        await service.stop()
+
+
+async def test_wait_newer_not_streaming_returns_none():
+    service = TelemetryService(SimpleNamespace(telemetry=None, mission=None))
+    assert await service.wait_newer("status_text", after=0.0, timeout=0.1) is None
+
+
+# ----------------------------------------------------------------------------
+# get_status
+# ----------------------------------------------------------------------------
+
+def _health():
+    return SimpleNamespace(**{field: True for _, field in droneserver._HEALTH_FIELDS})
+
+
+@pytest.fixture
+def status_connector(monkeypatch):
+    monkeypatch.setattr(droneserver, "log_tool_call", lambda *args, **kwargs: None)
+    telemetry = SimpleNamespace(
+        armed=_stream(True),
+        in_air=_stream(False),
+        health=_stream(_health()),
+    )
+    connector = MAVLinkConnector(drone=SimpleNamespace(telemetry=telemetry))
+    connector.connection_ready.set()
+    monkeypatch.setattr(droneserver, "_get_connector", lambda ctx: connector)
+    return connector
+
+
+async def test_get_status_success(status_connector):
+    result = await droneserver.get_status(None)
+    assert result["status"] == "success"
+    assert result["armed"] is True
+    assert result["in_air"] is False
+    assert result["health"]["overall_status"] == "HEALTHY"
+    assert result["age_s"] == 0.0
+    assert "errors" not in result
+
+
+async def test_get_status_partial_failure_is_failed(status_connector):
+    async def broken():
+        raise RuntimeError("link lost")
+        yield  # pragma: no cover
+
+    status_connector.drone.telemetry.in_air = broken
+    result = await droneserver.get_status(None)
+    assert result["status"] == "failed"
+    assert result["errors"] == {"in_air": "link lost"}
+    assert "in_air: link lost" in result["error"]
+    assert result["armed"] is True
+    assert result["in_air"] is None
+    assert result["health"]["overall_status"] == "HEALTHY"